@@ -1,5 +1,9 @@
+from collections import Counter
+from functools import lru_cache
+
 import maya.cmds as cmds
 import maya.OpenMayaUI as omui
+import maya.api.OpenMaya as om
 
 from PySide2 import QtCore, QtWidgets
 from shiboken2 import wrapInstance
@@ -20,6 +24,7 @@ def maya_main_window():
 # Alembic Hold Logic
 # ============================================================
 
+@lru_cache(maxsize=8192)
 def _sanitize_name(name: str) -> str:
     return name.replace(":", "_").replace("|", "_")
 
@@ -31,6 +36,20 @@ def _safe_disconnect(dst_attr: str) -> None:
         except Exception:
             pass
 
+def _safe_disconnect_many(dst_attrs) -> None:
+    # One sweep for all plugs: returns [dst0, src0, dst1, src1, ...]
+    if not dst_attrs:
+        return
+    pairs = cmds.listConnections(dst_attrs, s=True, d=False, p=True, connections=True) or []
+    for dst, src in zip(pairs[0::2], pairs[1::2]):
+        try:
+            cmds.disconnectAttr(src, dst)
+        except Exception:
+            pass
+
+def _hold_expr_name(abc: str) -> str:
+    return _sanitize_name(abc) + "_hold_expr"
+
 def _hold_rhs_expression(start: float, hold_n: int) -> str:
     # sample_time = floor((t - start)/N)*N + start
     return f"floor((time1.outTime - {start})/{hold_n})*{hold_n} + {start}"
@@ -43,13 +62,14 @@ def apply_hold(alembic_nodes, hold_n: int) -> None:
     start = cmds.playbackOptions(q=True, min=True)
     rhs = _hold_rhs_expression(start, hold_n)
 
-    for abc in alembic_nodes:
-        if not cmds.objExists(abc) or cmds.nodeType(abc) != "AlembicNode":
-            continue
+    valid = [
+        abc for abc in alembic_nodes
+        if cmds.objExists(abc) and cmds.nodeType(abc) == "AlembicNode"
+    ]
+    _safe_disconnect_many([f"{abc}.time" for abc in valid])
 
-        _safe_disconnect(f"{abc}.time")
-
-        exp_name = _sanitize_name(abc) + "_hold_expr"
+    for abc in valid:
+        exp_name = _hold_expr_name(abc)
         if cmds.objExists(exp_name):
             try:
                 cmds.delete(exp_name)
@@ -71,7 +91,7 @@ def remove_hold(alembic_nodes) -> None:
         if not cmds.objExists(abc) or cmds.nodeType(abc) != "AlembicNode":
             continue
 
-        exp_name = _sanitize_name(abc) + "_hold_expr"
+        exp_name = _hold_expr_name(abc)
         if cmds.objExists(exp_name):
             try:
                 cmds.delete(exp_name)
@@ -90,9 +110,11 @@ def remove_hold(alembic_nodes) -> None:
 # Namespace inference for tree grouping (your logic + minor tweaks)
 # ============================================================
 
+@lru_cache(maxsize=8192)
 def _ns_root_from_name(node_name: str):
     return node_name.split(":", 1)[0] if ":" in node_name else None
 
+@lru_cache(maxsize=8192)
 def _type_prefix(ns_root: str) -> str:
     if not ns_root or ns_root == "NO_NAMESPACE":
         return "NO_NAMESPACE"
@@ -132,11 +154,9 @@ def _infer_asset_namespace_from_alembicnode(abc_node: str) -> str:
                 candidates.append(ns)
 
     if candidates:
-        counts = {}
-        for ns in candidates:
-            counts[ns] = counts.get(ns, 0) + 1
-        best = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[0][0]
-        return best
+        # Most frequent namespace; ties go to the alphabetically first one
+        counts = Counter(candidates)
+        return min(counts.items(), key=lambda kv: (-kv[1], kv[0]))[0]
 
     ns_self = _ns_root_from_name(abc_node)
     if ns_self:
@@ -145,37 +165,75 @@ def _infer_asset_namespace_from_alembicnode(abc_node: str) -> str:
     return "NO_NAMESPACE"
 
 
+# AlembicNode -> inferred asset namespace. Cleared on scene new/open and on a
+# full tree refresh, so lookups stay pure-Python between those points.
+_NS_CACHE = {}
+_NS_CACHE_JOBS = []
+
+def _clear_ns_cache():
+    _NS_CACHE.clear()
+    # Pure string helpers; cleared alongside so node names from old scenes don't pile up
+    _ns_root_from_name.cache_clear()
+    _type_prefix.cache_clear()
+    _sanitize_name.cache_clear()
+
+def _abc2on2_ns_cache_job():
+    # The name tags our scriptJobs: listJobs shows the callable, so a re-exec
+    # of this script (fresh module globals) can find the previous run's jobs
+    _clear_ns_cache()
+
+def _install_ns_cache_jobs():
+    if any(cmds.scriptJob(exists=j) for j in _NS_CACHE_JOBS):
+        return
+    del _NS_CACHE_JOBS[:]
+    # Jobs left by an earlier exec still hold that run's functions; drop them
+    for job in cmds.scriptJob(listJobs=True) or []:
+        if _abc2on2_ns_cache_job.__name__ in job:
+            cmds.scriptJob(kill=int(job.split(":", 1)[0]), force=True)
+    for event in ("SceneOpened", "NewSceneOpened"):
+        _NS_CACHE_JOBS.append(cmds.scriptJob(event=[event, _abc2on2_ns_cache_job]))
+
+def _cached_asset_namespace(abc_node: str) -> str:
+    ns = _NS_CACHE.get(abc_node)
+    if ns is None:
+        ns = _NS_CACHE[abc_node] = _infer_asset_namespace_from_alembicnode(abc_node)
+    return ns
+
+def _alembic_nodes_in_namespace(inferred_ns: str):
+    # One ls for liveness; namespace matching is a cache scan
+    return [
+        abc for abc in cmds.ls(type="AlembicNode") or []
+        if _cached_asset_namespace(abc) == inferred_ns
+    ]
+
+
 # ============================================================
 # Keep-travel solver (FAST) — single vertex, single bake, drives whole character group
 # Goal: Frame 2 pose = frame 1, but translate to match frame 2 position.
 # ============================================================
 
-def _normalize_vertex_to_transform(vtx: str) -> str:
+def _mesh_from_vertex(vtx: str):
     """
-    Accept both:
+    Resolve either of:
       meshTransform.vtx[12]
       meshShape.vtx[12]
-    and normalize to transform component.
+    to (mesh_transform, mesh_shape) straight from the DAG path.
+    Returns (None, None) if the component doesn't live on a mesh.
     """
-    if ".vtx[" not in vtx:
-        return vtx
-
-    base = vtx.split(".vtx[", 1)[0]
-    rest = ".vtx[" + vtx.split(".vtx[", 1)[1]
-
-    if cmds.objExists(base) and cmds.nodeType(base) == "mesh":
-        parent = cmds.listRelatives(base, parent=True, fullPath=False) or []
-        if parent:
-            return parent[0] + rest
+    try:
+        sel = om.MSelectionList()
+        sel.add(vtx)
+        dag = sel.getDagPath(0)
+        dag.extendToShape()
+    except RuntimeError:
+        return None, None
 
-    return vtx
+    if not dag.hasFn(om.MFn.kMesh):
+        return None, None
 
-def _mesh_shape_from_transform(xform: str):
-    shapes = cmds.listRelatives(xform, shapes=True, ni=True, fullPath=False) or []
-    for s in shapes:
-        if cmds.nodeType(s) == "mesh":
-            return s
-    return None
+    xform = om.MDagPath(dag)
+    xform.pop()
+    return xform.partialPathName(), dag.partialPathName()
 
 def _find_driving_alembic(mesh_shape: str):
     # Typical connection: AlembicNode.outPolyMesh -> meshShape.inMesh
@@ -264,15 +322,11 @@ def _build_keep_travel_from_vertex(
     """
     hold_n = max(int(hold_n), 1)
 
-    vtx = _normalize_vertex_to_transform(vtx)
-    mesh_xform = vtx.split(".vtx[", 1)[0]
-    if not cmds.objExists(mesh_xform) or cmds.nodeType(mesh_xform) != "transform":
-        raise RuntimeError("Vertex must resolve to a mesh transform. Got: %s" % mesh_xform)
+    mesh_xform, mesh_shape = _mesh_from_vertex(vtx)
+    if not mesh_xform:
+        raise RuntimeError("Vertex must resolve to a mesh transform. Got: %s" % vtx)
 
     ns_root = _ns_root_from_name(mesh_xform) or "NO_NAMESPACE"
-    mesh_shape = _mesh_shape_from_transform(mesh_xform)
-    if not mesh_shape:
-        raise RuntimeError("Can't find mesh shape under: %s" % mesh_xform)
 
     sample_abc = _find_driving_alembic(mesh_shape)
     if not sample_abc:
@@ -291,11 +345,8 @@ def _build_keep_travel_from_vertex(
     else:
         # Auto: all AlembicNodes that live in the same inferred namespace group as the sample node.
         # This is conservative and matches how you group in the tree.
-        inferred_ns = _infer_asset_namespace_from_alembicnode(sample_abc)
-        hold_abcs = []
-        for abc in cmds.ls(type="AlembicNode") or []:
-            if _infer_asset_namespace_from_alembicnode(abc) == inferred_ns:
-                hold_abcs.append(abc)
+        inferred_ns = _cached_asset_namespace(sample_abc)
+        hold_abcs = _alembic_nodes_in_namespace(inferred_ns)
 
     # Locator + constraint names
     base = _sanitize_name(ns_root if ns_root != "NO_NAMESPACE" else mesh_xform)
@@ -442,6 +493,7 @@ def remove_keep_travel(ns_or_mesh: str):
 
 class AlembicHoldOnNWindow(QtWidgets.QDialog):
     WINDOW_NAME = "AlembicHoldOnNWindow_Qt"
+    POPULATE_CHUNK = 100  # AlembicNode items inserted per event-loop pass
 
     def __init__(self, parent=maya_main_window()):
         super().__init__(parent)
@@ -450,8 +502,26 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
         self.setMinimumSize(1000, 600)  # Wider for 2-column layout
         self.resize(1200, 700)  # Default size
 
+        # Tree item indices so Apply/Remove can mutate items in place
+        self._abc_items = {}    # AlembicNode -> QTreeWidgetItem
+        self._type_items = {}   # type_key -> QTreeWidgetItem
+        self._ns_items = {}     # (type_key, ns_root) -> QTreeWidgetItem
+
+        # Progressive population state
+        self._pending = []          # [(type_key, ns_root, [AlembicNode...]), ...]
+        self._loading_items = {}    # type_key -> "Loading..." placeholder item
+        self._populating = False
+        self._populated = False
+
+        _install_ns_cache_jobs()
         self._build_ui()
-        self.refresh_tree()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Paint the empty dialog first, then scan the scene
+        if not self._populated:
+            self._populated = True
+            QtCore.QTimer.singleShot(0, self.refresh_tree)
 
     # ---------------- UI ----------------
 
@@ -610,34 +680,133 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
     # ---------------- Tree ----------------
 
     def refresh_tree(self):
+        """
+        Full rebuild. Only the Refresh button should need this.
+
+        Type groups are created right away; their children are inserted in
+        chunks from the event loop so big scenes don't freeze the dialog.
+        """
         self.tree.clear()
+        self._abc_items.clear()
+        self._type_items.clear()
+        self._ns_items.clear()
+        self._loading_items.clear()
+        self._pending = []
+        _clear_ns_cache()
 
         abc_nodes = cmds.ls(type="AlembicNode") or []
         abc_nodes.sort()
 
         groups = {}  # groups[type_prefix][ns_root] = [AlembicNode...]
         for abc in abc_nodes:
-            ns_root = _infer_asset_namespace_from_alembicnode(abc)
+            ns_root = _cached_asset_namespace(abc)
             type_key = _type_prefix(ns_root)
             groups.setdefault(type_key, {}).setdefault(ns_root, []).append(abc)
 
-        for type_key in sorted(groups.keys()):
-            type_item = QtWidgets.QTreeWidgetItem([type_key])
-            type_item.setFirstColumnSpanned(True)
-            self.tree.addTopLevelItem(type_item)
+        # abc_nodes is already sorted, so each ns list is built in order
+        for type_key in sorted(groups):
+            type_item = self._type_item(type_key)
 
-            for ns_root in sorted(groups[type_key].keys()):
-                ns_item = QtWidgets.QTreeWidgetItem([ns_root])
-                type_item.addChild(ns_item)
+            loading = QtWidgets.QTreeWidgetItem(["Loading..."])
+            loading.setFlags(QtCore.Qt.NoItemFlags)
+            type_item.addChild(loading)
+            self._loading_items[type_key] = loading
 
-                for abc in sorted(groups[type_key][ns_root]):
-                    node_item = QtWidgets.QTreeWidgetItem([abc])
-                    node_item.setData(0, QtCore.Qt.UserRole, abc)
-                    ns_item.addChild(node_item)
+            for ns_root in sorted(groups[type_key]):
+                self._pending.append((type_key, ns_root, groups[type_key][ns_root]))
 
             type_item.setExpanded(True)
 
-        self.tree.resizeColumnToContents(0)
+        if self._pending and not self._populating:
+            self._populating = True
+            QtCore.QTimer.singleShot(0, self._populate_chunk)
+
+    def _populate_chunk(self):
+        added = 0
+        while self._pending and added < self.POPULATE_CHUNK:
+            type_key, ns_root, abcs = self._pending[0]
+            take = abcs[:self.POPULATE_CHUNK - added]
+            del abcs[:len(take)]
+            if not abcs:
+                self._pending.pop(0)
+
+            # Items may already exist if Apply/Remove synced them mid-population
+            items = [self._make_abc_item(abc) for abc in take if abc not in self._abc_items]
+            self._ns_item(type_key, ns_root).addChildren(items)
+            added += len(take)
+
+            if not self._pending or self._pending[0][0] != type_key:
+                loading = self._loading_items.pop(type_key, None)
+                if loading is not None and loading.parent() is not None:
+                    loading.parent().removeChild(loading)
+
+        if self._pending:
+            QtCore.QTimer.singleShot(0, self._populate_chunk)
+        else:
+            self._populating = False
+            # Size the column once, after the last chunk landed
+            QtCore.QTimer.singleShot(0, self._resize_tree_column)
+
+    def _resize_tree_column(self):
+        if self.tree.viewport().isVisible():
+            self.tree.resizeColumnToContents(0)
+
+    def _type_item(self, type_key):
+        item = self._type_items.get(type_key)
+        if item is None:
+            item = QtWidgets.QTreeWidgetItem([type_key])
+            self.tree.addTopLevelItem(item)
+            item.setFirstColumnSpanned(True)
+            self._type_items[type_key] = item
+        return item
+
+    def _ns_item(self, type_key, ns_root):
+        item = self._ns_items.get((type_key, ns_root))
+        if item is None:
+            item = QtWidgets.QTreeWidgetItem([ns_root])
+            self._type_item(type_key).addChild(item)
+            self._ns_items[(type_key, ns_root)] = item
+        return item
+
+    def _make_abc_item(self, abc):
+        item = QtWidgets.QTreeWidgetItem([abc])
+        item.setData(0, QtCore.Qt.UserRole, abc)
+        self._abc_items[abc] = item
+        return item
+
+    def _add_abc_item(self, abc):
+        ns_root = _cached_asset_namespace(abc)
+        type_key = _type_prefix(ns_root)
+        self._ns_item(type_key, ns_root).addChild(self._make_abc_item(abc))
+
+    def _remove_abc_item(self, abc):
+        item = self._abc_items.pop(abc, None)
+        if item is None:
+            return
+        ns_item = item.parent()
+        ns_item.removeChild(item)
+        if ns_item.childCount():
+            return
+
+        # Drop emptied group items as well
+        type_item = ns_item.parent()
+        type_item.removeChild(ns_item)
+        for key, value in list(self._ns_items.items()):
+            if value is ns_item:
+                del self._ns_items[key]
+        if not type_item.childCount():
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(type_item))
+            for key, value in list(self._type_items.items()):
+                if value is type_item:
+                    del self._type_items[key]
+
+    def _sync_abc_items(self, nodes):
+        """Update only the touched items instead of rebuilding the tree."""
+        for abc in nodes:
+            if not cmds.objExists(abc):
+                self._remove_abc_item(abc)
+            elif abc not in self._abc_items:
+                self._add_abc_item(abc)
 
     def _selected_alembic_nodes(self):
         nodes = []
@@ -645,11 +814,8 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
             node = item.data(0, QtCore.Qt.UserRole)
             if isinstance(node, str) and node:
                 nodes.append(node)
-        out = []
-        for n in nodes:
-            if n not in out:
-                out.append(n)
-        return out
+        # Ordered de-dup in O(n)
+        return list(dict.fromkeys(nodes))
 
     # ---------------- Hold actions ----------------
 
@@ -657,12 +823,14 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
         nodes = self._selected_alembic_nodes()
         hold_n = int(self.hold_spin.value())
         apply_hold(nodes, hold_n)
+        self._sync_abc_items(nodes)
         cmds.inViewMessage(amg=f'Applied <hl>ON{hold_n}</hl> hold to {len(nodes)} AlembicNode(s).',
                            pos='topCenter', fade=True)
 
     def remove_from_selected(self):
         nodes = self._selected_alembic_nodes()
         remove_hold(nodes)
+        self._sync_abc_items(nodes)
         cmds.inViewMessage(amg=f'Removed hold from {len(nodes)} AlembicNode(s).',
                            pos='topCenter', fade=True)
 
@@ -670,12 +838,14 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
         nodes = cmds.ls(type="AlembicNode") or []
         hold_n = int(self.hold_spin.value())
         apply_hold(nodes, hold_n)
+        self._sync_abc_items(nodes)
         cmds.inViewMessage(amg=f'Applied <hl>ON{hold_n}</hl> hold to ALL ({len(nodes)}) AlembicNode(s).',
                            pos='topCenter', fade=True)
 
     def remove_from_all(self):
         nodes = cmds.ls(type="AlembicNode") or []
         remove_hold(nodes)
+        self._sync_abc_items(nodes)
         cmds.inViewMessage(amg=f'Removed hold from ALL ({len(nodes)}) AlembicNode(s).',
                            pos='topCenter', fade=True)
 
@@ -706,14 +876,13 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
             # selected in tree
             nodes = self._selected_alembic_nodes()
             apply_hold(nodes, hold_n)
+            self._sync_abc_items(nodes)
             self.status_label.setText(f"Hold ON{hold_n} applied to {len(nodes)} selected AlembicNode(s).")
             return
 
         # Auto from vertex asset: we run a lightweight keep-travel builder in 'hold only' mode (no bake),
         # reusing the same inference method: use sample alembic, then apply hold to all in inferred namespace.
-        vtx_norm = _normalize_vertex_to_transform(vtx)
-        mesh_xform = vtx_norm.split(".vtx[", 1)[0]
-        mesh_shape = _mesh_shape_from_transform(mesh_xform)
+        mesh_xform, mesh_shape = _mesh_from_vertex(vtx)
         if not mesh_shape:
             self.status_label.setText("Could not find mesh shape from selected vertex.")
             return
@@ -723,13 +892,11 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
             self.status_label.setText("Could not find AlembicNode driving that mesh.")
             return
 
-        inferred_ns = _infer_asset_namespace_from_alembicnode(sample_abc)
-        hold_abcs = []
-        for abc in cmds.ls(type="AlembicNode") or []:
-            if _infer_asset_namespace_from_alembicnode(abc) == inferred_ns:
-                hold_abcs.append(abc)
+        inferred_ns = _cached_asset_namespace(sample_abc)
+        hold_abcs = _alembic_nodes_in_namespace(inferred_ns)
 
         apply_hold(hold_abcs, hold_n)
+        self._sync_abc_items(hold_abcs)
         self.status_label.setText(f"Hold ON{hold_n} applied to asset group '{inferred_ns}' ({len(hold_abcs)} AlembicNodes).")
 
     def build_keep_travel_from_vertex(self):
@@ -764,6 +931,8 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
             self.status_label.setText("ERROR: %s" % e)
             raise
 
+        self._sync_abc_items(info["hold_abcs"])
+
         msg = f"Built keep-travel for {info['ns_root']} | target={info['target']} | holdNodes={len(info['hold_abcs'])}"
         if apply_constraint:
             msg += " | constraint=ON"
@@ -782,8 +951,10 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
             self.status_label.setText("No vertex selected. Select a vertex from the asset you want to clean.")
             return
 
-        vtx_norm = _normalize_vertex_to_transform(vtx)
-        mesh_xform = vtx_norm.split(".vtx[", 1)[0]
+        mesh_xform, _ = _mesh_from_vertex(vtx)
+        if not mesh_xform:
+            self.status_label.setText("Could not find mesh from selected vertex.")
+            return
         ns_root = _ns_root_from_name(mesh_xform) or mesh_xform
 
         remove_keep_travel(ns_root)
@@ -793,19 +964,27 @@ class AlembicHoldOnNWindow(QtWidgets.QDialog):
 
 
 def show_alembic_hold_on_n_ui():
-    # Close existing window if open
-    for w in QtWidgets.QApplication.allWidgets():
-        if w.objectName() == AlembicHoldOnNWindow.WINDOW_NAME:
-            try:
-                w.close()
-                w.deleteLater()
-            except Exception:
-                pass
+    # Close existing window if open. Use the cached instance rather than
+    # walking QApplication.allWidgets(); after a script re-run the cache is
+    # gone, so fall back to a C++-side findChild on Maya's main window.
+    existing = getattr(show_alembic_hold_on_n_ui, "_dlg", None)
+    if existing is None:
+        main = maya_main_window()
+        if main is not None:
+            existing = main.findChild(QtWidgets.QDialog, AlembicHoldOnNWindow.WINDOW_NAME)
+    if existing is not None:
+        try:
+            existing.close()
+            existing.deleteLater()
+        except Exception:
+            pass
 
     dlg = AlembicHoldOnNWindow()
     dlg.show()
+    show_alembic_hold_on_n_ui._dlg = dlg
     return dlg
 
 
-# Execute
-show_alembic_hold_on_n_ui()
+# Allow running from Maya Script Editor
+if __name__ == "__main__":
+    show_alembic_hold_on_n_ui()
@@ -1,8 +1,238 @@
 import maya.cmds as cmds
 import maya.api.OpenMaya as om2
-from functools import partial
+from functools import lru_cache, partial
+import logging
 import math
 import re
+import sys
+
+# NumPy ships with recent mayapy builds; fall back to per-bbox tests without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Diagnostics go through logging (quiet by default); the UI "Verbose Log"
+# checkbox switches this to DEBUG.
+log = logging.getLogger('refcleanup')
+log.setLevel(logging.WARNING)
+
+# Filename/namespace classifiers used by parse_reference_type (compiled once)
+_SHADER_FILE_RE = re.compile(r'_(?:rs)?shade')
+_SHADER_FILE_SUFFIX_RE = re.compile(r'(?:_shade|_rsshade)?\.ma')
+_GEO_FILE_RE = re.compile(r'_geo|\.abc')
+_CAMERA_RE = re.compile(r'camera', re.IGNORECASE)
+# SDRS_ namespace tokens dropped when deriving the shader's asset name
+_SHADER_SUFFIXES = frozenset(('shade', 'shader', 'shd'))
+
+# Category/type keys, interned so the hot-loop compares hit the identity fast path
+_CAT_GEO = sys.intern('GEO')
+_CAT_SHADER = sys.intern('SHADER')
+_CAT_CHAR = sys.intern('CHAR')
+_CAT_PROP = sys.intern('PROP')
+_CAT_VEH = sys.intern('VEH')
+_CAT_ENV = sys.intern('ENV')
+_CAT_SET = sys.intern('SET')
+_CAT_OTHER = sys.intern('OTHER')
+_CAT_CAMERA = sys.intern('CAMERA')
+
+# exactWorldBoundingBox [xmin, ymin, zmin, xmax, ymax, zmax] -> 8 corner index triples
+_BBOX_CORNER_IDX = (
+    (0, 1, 2), (3, 1, 2), (0, 4, 2), (3, 4, 2),
+    (0, 1, 5), (3, 1, 5), (0, 4, 5), (3, 4, 5),
+)
+
+def _index_by_namespace(leaf_by_path):
+    """Bucket full DAG paths ({path: leaf name}) by the leaf's namespace."""
+    ns_index = {}
+    for path, leaf in leaf_by_path.items():
+        ns_index.setdefault(leaf.rpartition(':')[0], []).append(path)
+    return ns_index
+
+
+# Filter checkbox key -> bit; a filter state is the OR of its enabled bits
+_FILTER_BITS = {_CAT_GEO: 1, _CAT_SHADER: 2, _CAT_CHAR: 4, _CAT_PROP: 8, _CAT_OTHER: 16}
+# display_type -> filter bit; anything unlisted falls under OTHER
+_DISPLAY_TO_BIT = {_CAT_SHADER: 2, _CAT_CHAR: 4, _CAT_PROP: 8, _CAT_GEO: 1, _CAT_SET: 1}
+
+
+def _filter_mask(filters):
+    """Fold a filter-state dict into an int mask of enabled bits."""
+    mask = 0
+    for key, enabled in filters.items():
+        if enabled:
+            mask |= _FILTER_BITS.get(key, 0)
+    return mask
+
+
+class RefType:
+    """
+    Parsed classification of one reference. Instances come out of the
+    _parse_ns cache and may be shared, so treat them as read-only.
+    """
+    __slots__ = (
+        'category', 'name', 'id', 'kind', 'type', 'display_type',
+        'geo_name', 'shader_target', 'is_geo',
+        'geo_name_lc', 'shader_target_lc', 'filter_bit',
+    )
+
+    def __init__(self, category, name, id='', kind='', type='', display_type='',
+                 geo_name='', shader_target='', is_geo=False):
+        # Category can come from parts[0].upper(), which is never interned;
+        # interning all three keeps `is` compares against _CAT_* valid
+        self.category = sys.intern(category)
+        self.name = name
+        self.id = id
+        self.kind = kind
+        self.type = sys.intern(type)
+        self.display_type = sys.intern(display_type)
+        self.geo_name = geo_name
+        self.shader_target = shader_target
+        self.is_geo = is_geo
+        # Case-folded match keys, computed once per reference
+        self.geo_name_lc = geo_name.lower()
+        self.shader_target_lc = shader_target.lower()
+        self.filter_bit = _DISPLAY_TO_BIT.get(display_type, _FILTER_BITS[_CAT_OTHER])
+
+
+def _category_reference(category, parts, is_geo):
+    """Has category prefix: CHAR_CatStompie_002"""
+    # Extract name without the last part (which is usually the ID)
+    name_parts = parts[1:-1] if len(parts) > 2 else [parts[1]]
+    name = '_'.join(name_parts)
+    
+    return RefType(
+        category=category,
+        name=name,
+        id=parts[-1],
+        kind='geo' if is_geo else 'asset',
+        type=_CAT_GEO if is_geo else category,
+        display_type=category,
+        geo_name=name,  # Used for shader matching
+        is_geo=is_geo
+    )
+
+
+def _set_reference(category, parts, is_geo):
+    """No category prefix, likely SET: CBDAExtTreeC_154"""
+    # Last part is an ID if it starts with a digit (slice is safe on '')
+    last = parts[-1]
+    if last[:1].isdigit():
+        name = '_'.join(parts[:-1])
+        id_part = last
+    else:
+        name = '_'.join(parts)
+        id_part = ''
+    
+    return RefType(
+        category=_CAT_SET,
+        name=name,
+        id=id_part,
+        kind='geo' if is_geo else 'asset',
+        type=_CAT_GEO if is_geo else _CAT_SET,
+        display_type=_CAT_SET,
+        geo_name=name,
+        is_geo=is_geo
+    )
+
+
+# Upper-cased first namespace token -> handler; unknown tokens are SETs
+_CATEGORY_TABLE = {
+    _CAT_CHAR: _category_reference,
+    _CAT_PROP: _category_reference,
+    _CAT_VEH: _category_reference,
+    _CAT_ENV: _category_reference,
+}
+
+
+def _classify_reference(full_namespace, short_name):
+    """
+    Parse reference type from filename and namespace.
+    Returns: RefType
+    """
+    full_namespace = full_namespace.strip(':')
+    filename = short_name.lower()
+
+    # For nested namespaces like "SETS_CentralBusinessDistrictAExt_001:CBDAExtTreeA_016"
+    # Extract only the LAST part for matching (CBDAExtTreeA_016)
+    if ':' in full_namespace:
+        namespace = full_namespace.split(':')[-1]  # Get last part after ':'
+    else:
+        namespace = full_namespace
+    
+    # Check if it's a camera
+    # filename is already lower-cased; the namespace is searched as-is
+    if _CAMERA_RE.search(namespace) or 'camera' in filename:
+        return RefType(
+            category=_CAT_CAMERA,
+            name=namespace,
+            id='',
+            kind='camera',
+            type=_CAT_CAMERA,
+            display_type=_CAT_CAMERA
+        )
+    
+    # Parse standard namespace: {CATEGORY}_{Name}_{ID}
+    # Examples: CHAR_CatStompie_002, CBDAExtTreeC_154
+    parts = namespace.split('_')
+    
+    # Parse shader namespace: SDRS_CBDAExtBuildA_Shade
+    if len(parts) > 1 and parts[0] == 'SDRS':
+        # Get the asset name (remove SDRS_ prefix and _Shade suffix)
+        name_parts = [p for p in parts[1:] if p.lower() not in _SHADER_SUFFIXES]
+        name = '_'.join(name_parts) if name_parts else parts[1]
+        
+        return RefType(
+            category='SDRS',
+            name=name,
+            id='',
+            kind='Shade',
+            type=_CAT_SHADER,
+            display_type=_CAT_SHADER,
+            shader_target=name  # Used for matching geo
+        )
+    
+    # Shader by filename (_shade/_rsshade)
+    if _SHADER_FILE_RE.search(filename):
+        base_name = _SHADER_FILE_SUFFIX_RE.sub('', filename)
+        return RefType(
+            category=_CAT_SHADER,
+            name=base_name,
+            id='',
+            kind='shade',
+            type=_CAT_SHADER,
+            display_type=_CAT_SHADER,
+            shader_target=base_name
+        )
+    
+    # Check if it's a geometry file
+    is_geo = _GEO_FILE_RE.search(filename) is not None
+    
+    if len(parts) < 2:
+        # Single part namespace
+        return RefType(
+            category=_CAT_OTHER,
+            name=namespace,
+            id='',
+            kind='unknown',
+            type=_CAT_OTHER,
+            display_type=_CAT_OTHER,
+            is_geo=is_geo
+        )
+    
+    # One table probe on the first token instead of a chain of prefix tests
+    category = parts[0].upper()
+    handler = _CATEGORY_TABLE.get(category, _set_reference)
+    return handler(category, parts, is_geo)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ns(namespace, short_name):
+    """Memoized _classify_reference."""
+    return _classify_reference(namespace, short_name)
+
 
 class ReferenceCleanupUI:
     def __init__(self):
@@ -11,165 +241,70 @@ class ReferenceCleanupUI:
         self.all_references = []
         self.visible_references = []
         self.invisible_references = []
+        # node -> ref_data indexes kept in sync with the two lists above
+        self._visible_by_node = {}
+        self._invisible_by_node = {}
+        # Display string -> ref_data for the rows currently in each list
+        self._visible_by_display = {}
+        self._invisible_by_display = {}
+        # Rows last pushed to each textScrollList, in widget order
+        self._visible_display = []
+        self._invisible_display = []
+        # Lower-cased name -> refs, rebuilt per scan
+        self._geos_by_name = {}
+        self._shaders_by_target = {}
+        # Bumped on every visible-list mutation; keys _geo_names_cache
+        self._vis_generation = 0
+        self._geo_names_cache = (None, (0, ()))
         self.selected_camera = None
         self.frustum_padding = 1.1
+        # node -> 'visible'/'invisible' for refs moved by hand; kept by Refresh
+        self._user_placement = {}
+        # Visible transform path -> leaf node name from the last frustum pass
+        self._leaf_by_path = {}
         
         # Filter states
         self.filter_visible = {'GEO': True, 'SHADER': True, 'CHAR': True, 'PROP': True, 'SET': True, 'OTHER': True}
         self.filter_invisible = {'GEO': True, 'SHADER': True, 'CHAR': True, 'PROP': True, 'SET': True, 'OTHER': True}
+        # Enabled filter bits, rebuilt whenever a checkbox changes
+        self._vis_mask = _filter_mask(self.filter_visible)
+        self._inv_mask = _filter_mask(self.filter_invisible)
         
     def parse_reference_type(self, ref_data):
         """
         Parse reference type from filename and namespace.
-        Returns: dict with 'category', 'name', 'id', 'kind', 'type'
+        Returns: RefType (shared, read-only)
         """
-        full_namespace = ref_data['namespace'].strip(':')
-        filename = ref_data['short_name'].lower()
-
-        # For nested namespaces like "SETS_CentralBusinessDistrictAExt_001:CBDAExtTreeA_016"
-        # Extract only the LAST part for matching (CBDAExtTreeA_016)
-        if ':' in full_namespace:
-            namespace = full_namespace.split(':')[-1]  # Get last part after ':'
-        else:
-            namespace = full_namespace
-        
-        # Check if it's a camera
-        if 'camera' in namespace.lower() or 'camera' in filename:
-            return {
-                'category': 'CAMERA',
-                'name': namespace,
-                'id': '',
-                'kind': 'camera',
-                'type': 'CAMERA',
-                'display_type': 'CAMERA'
-            }
-        
-        # Check if it's a shader (SDRS prefix or _shade/_rsshade in filename)
-        if namespace.startswith('SDRS_') or '_shade' in filename or '_rsshade' in filename:
-            # Parse shader namespace: SDRS_CBDAExtBuildA_Shade
-            if namespace.startswith('SDRS_'):
-                parts = namespace.split('_')
-                # Get the asset name (remove SDRS_ prefix and _Shade suffix)
-                name_parts = [p for p in parts[1:] if p.lower() not in ['shade', 'shader', 'shd']]
-                name = '_'.join(name_parts) if name_parts else parts[1] if len(parts) > 1 else namespace
-                
-                return {
-                    'category': 'SDRS',
-                    'name': name,
-                    'id': '',
-                    'kind': 'Shade',
-                    'type': 'SHADER',
-                    'display_type': 'SHADER',
-                    'shader_target': name  # Used for matching geo
-                }
-            else:
-                # Extract name from filename if it has _shade pattern
-                base_name = filename.replace('_shade.ma', '').replace('_rsshade.ma', '').replace('.ma', '')
-                return {
-                    'category': 'SHADER',
-                    'name': base_name,
-                    'id': '',
-                    'kind': 'shade',
-                    'type': 'SHADER',
-                    'display_type': 'SHADER',
-                    'shader_target': base_name
-                }
-        
-        # Parse standard namespace: {CATEGORY}_{Name}_{ID}
-        # Examples: CHAR_CatStompie_002, CBDAExtTreeC_154
-        parts = namespace.split('_')
-        
-        # Check if it's a geometry file
-        is_geo = '_geo' in filename or '.abc' in filename
-        
-        if len(parts) >= 2:
-            # Check if first part is a known category
-            first_part = parts[0].upper()
-            known_categories = ['CHAR', 'PROP', 'VEH', 'ENV']
-            
-            if first_part in known_categories:
-                # Has category prefix: CHAR_CatStompie_002
-                category = first_part
-                # Extract name without the last part (which is usually the ID)
-                name_parts = parts[1:-1] if len(parts) > 2 else [parts[1]]
-                name = '_'.join(name_parts)
-                id_part = parts[-1] if len(parts) > 1 else ''
-                
-                # Determine type
-                if is_geo:
-                    kind = 'geo'
-                    display_type = category
-                else:
-                    kind = 'asset'
-                    display_type = category
-                
-                return {
-                    'category': category,
-                    'name': name,
-                    'id': id_part,
-                    'kind': kind,
-                    'type': 'GEO' if is_geo else category,
-                    'display_type': category,
-                    'geo_name': name,  # Used for shader matching
-                    'is_geo': is_geo
-                }
-            else:
-                # No category prefix, likely SET: CBDAExtTreeC_154
-                # Check if last part is a number (ID)
-                if parts[-1].isdigit() or (len(parts[-1]) > 0 and parts[-1][0].isdigit()):
-                    name = '_'.join(parts[:-1])
-                    id_part = parts[-1]
-                else:
-                    name = '_'.join(parts)
-                    id_part = ''
-                
-                return {
-                    'category': 'SET',
-                    'name': name,
-                    'id': id_part,
-                    'kind': 'geo' if is_geo else 'asset',
-                    'type': 'GEO' if is_geo else 'SET',
-                    'display_type': 'SET',
-                    'geo_name': name,
-                    'is_geo': is_geo
-                }
-        else:
-            # Single part namespace
-            return {
-                'category': 'OTHER',
-                'name': namespace,
-                'id': '',
-                'kind': 'unknown',
-                'type': 'OTHER',
-                'display_type': 'OTHER',
-                'is_geo': is_geo
-            }
+        return _parse_ns(ref_data['namespace'], ref_data['short_name'])
     
+    def _build_name_indexes(self):
+        """
+        Build lower-cased geo_name -> [geo refs] and shader_target -> [shader refs]
+        lookups over all_references so shader/geo matching is a dict probe.
+        """
+        self._geos_by_name = {}
+        self._shaders_by_target = {}
+        for ref in self.all_references:
+            ref_info = ref['ref_type']
+            if ref_info.type is _CAT_SHADER:
+                shader_target = ref_info.shader_target_lc
+                if shader_target:
+                    self._shaders_by_target.setdefault(shader_target, []).append(ref)
+            elif ref_info.is_geo:
+                geo_name = ref_info.geo_name_lc
+                if geo_name:
+                    self._geos_by_name.setdefault(geo_name, []).append(ref)
+
     def find_related_geometry_by_name(self, shader_target):
         """
         Find all geometry references that match this shader target name.
         Returns list of ALL geo references (in any list) that match.
         """
-        related_geos = []
-        
-        print(f"    Searching for geometry matching shader target: '{shader_target}'")
-        
-        # Search through ALL references
-        for ref in self.all_references:
-            ref_info = ref['ref_type']
-            
-            # Only check geometry files
-            if not ref_info.get('is_geo', False):
-                continue
-            
-            # Get geo name for comparison
-            geo_name = ref_info.get('geo_name', '').lower()
-            
-            # Match shader target with geo name
-            if geo_name and shader_target and geo_name == shader_target.lower():
-                related_geos.append(ref)
-                print(f"      Found matching geo: {ref['namespace']}")
+        if not shader_target:
+            return []
         
+        related_geos = self._geos_by_name.get(shader_target.lower(), [])
+        log.debug("    Found %s geometry matching shader target: '%s'", len(related_geos), shader_target)
         return related_geos
     
     def find_shaders_for_geometry(self, geo_ref_data):
@@ -178,131 +313,151 @@ class ReferenceCleanupUI:
         Returns list of shader references from ALL lists.
         """
         geo_info = geo_ref_data['ref_type']
-        geo_name = geo_info.get('geo_name', '').lower()
+        geo_name = geo_info.geo_name_lc
         
         if not geo_name:
             return []
         
-        matching_shaders = []
-        
-        print(f"  Searching for shaders matching geo: '{geo_name}'")
-        
-        # Search through ALL references for shaders
-        for ref in self.all_references:
-            ref_info = ref['ref_type']
-            
-            if ref_info['type'] == 'SHADER':
-                shader_target = ref_info.get('shader_target', '').lower()
-                
-                print(f"    Checking shader: {ref['namespace']} (target: '{shader_target}')")
-                
-                if shader_target and shader_target == geo_name:
-                    matching_shaders.append(ref)
-                    print(f"      ✓ MATCH!")
-        
+        matching_shaders = self._shaders_by_target.get(geo_name, [])
+        log.debug("  Found %s shader(s) matching geo: '%s'", len(matching_shaders), geo_name)
         return matching_shaders
     
-    def is_ref_in_list(self, ref_data, ref_list):
-        """Check if a specific reference is in a list by comparing node"""
-        for ref in ref_list:
-            if ref['node'] == ref_data['node']:
-                return True
-        return False
-
-    def _auto_restore_matching_shaders(self):
+    def _add_visible(self, ref_data):
+        node = ref_data['node']
+        if node not in self._visible_by_node:
+            self._visible_by_node[node] = ref_data
+            self.visible_references.append(ref_data)
+            self._vis_generation += 1
+
+    def _add_invisible(self, ref_data):
+        node = ref_data['node']
+        if node not in self._invisible_by_node:
+            self._invisible_by_node[node] = ref_data
+            self.invisible_references.append(ref_data)
+
+    def _keep_geo_names(self):
         """
-        Automatically restore shaders that match geometry in the keep (visible) list.
-        Called after initial scan to ensure shaders stay with their geometry.
+        Return (geo ref count, unique geo names in keep-list order) for the
+        visible list. Cached until the visible list next mutates.
         """
-        print(f"\n{'='*60}")
-        print(f"Auto-Restoring Shaders for Geometry in Keep List")
-        print(f"{'='*60}")
+        generation, cached = self._geo_names_cache
+        if generation == self._vis_generation:
+            return cached
+        geo_count = 0
+        names = {}
+        for ref in self.visible_references:
+            ref_type = ref['ref_type']
+            if ref_type.is_geo:
+                geo_count += 1
+                if ref_type.geo_name_lc:
+                    names[ref_type.geo_name_lc] = None
+        cached = (geo_count, tuple(names))
+        self._geo_names_cache = (self._vis_generation, cached)
+        return cached
 
-        # Find all geometry in keep list
-        geo_in_keep = [ref for ref in self.visible_references if ref['ref_type'].get('is_geo', False)]
-
-        if not geo_in_keep:
-            print("No geometry in keep list - skipping shader auto-restore")
-            return
+    def _move_invisible_to_visible(self, nodes):
+        """
+        Move the refs for `nodes` from the invisible to the visible list.
+        Rebuilds the invisible list in one filtering pass instead of one
+        list.remove() scan per node. Returns the moved refs.
+        """
+        moved = []
+        for node in nodes:
+            ref = self._invisible_by_node.pop(node, None)
+            if ref is not None:
+                moved.append(ref)
+        if moved:
+            self.invisible_references[:] = [
+                ref for ref in self.invisible_references
+                if ref['node'] in self._invisible_by_node
+            ]
+            for ref in moved:
+                self._add_visible(ref)
+        return moved
 
-        print(f"Found {len(geo_in_keep)} geometry reference(s) in keep list")
+    def _mark_user_moved(self, refs, list_type):
+        """Remember manual placements so an incremental refresh keeps them."""
+        for ref in refs:
+            self._user_placement[ref['node']] = list_type
 
-        # Collect all geo names that need shaders
-        geo_names_in_keep = set()
-        for geo_ref in geo_in_keep:
-            geo_name = geo_ref['ref_type'].get('geo_name', '').lower()
-            if geo_name:
-                geo_names_in_keep.add(geo_name)
+    def _move_visible_to_invisible(self, nodes):
+        """Mirror of _move_invisible_to_visible for the Keep -> Remove direction."""
+        moved = []
+        for node in nodes:
+            ref = self._visible_by_node.pop(node, None)
+            if ref is not None:
+                moved.append(ref)
+        if moved:
+            self.visible_references[:] = [
+                ref for ref in self.visible_references
+                if ref['node'] in self._visible_by_node
+            ]
+            self._vis_generation += 1
+            for ref in moved:
+                self._add_invisible(ref)
+        return moved
 
-        print(f"Unique geo names to match: {geo_names_in_keep}")
+    def _auto_restore_matching_shaders(self, pending):
+        """
+        Place the non-geometry refs held back during the scan. Shaders whose
+        target matches geometry in the keep (visible) list go to Keep, the
+        rest go to Remove - one pass, no invisible -> visible churn.
+        """
+        log.info("Auto-Restoring Shaders for Geometry in Keep List")
 
-        # Find matching shaders in invisible list
-        shaders_to_move = []
+        # Geo names in keep list that need shaders
+        geo_count, geo_names_in_keep = self._keep_geo_names()
+        if geo_count:
+            log.debug("Found %s geometry reference(s) in keep list", geo_count)
+            log.debug("Unique geo names to match: %s", geo_names_in_keep)
+        else:
+            log.debug("No geometry in keep list - no shaders to auto-restore")
+        kept_names = frozenset(geo_names_in_keep)
 
-        for ref in self.invisible_references[:]:  # Copy list to avoid modification during iteration
+        restored = 0
+        for ref in pending:
             ref_info = ref['ref_type']
+            if ref_info.type is _CAT_SHADER and ref_info.shader_target_lc in kept_names:
+                self._add_visible(ref)
+                restored += 1
+                log.debug("  -> Auto-kept shader: %s (matches '%s')", ref['namespace'], ref_info.shader_target_lc)
+            else:
+                self._add_invisible(ref)
 
-            if ref_info['type'] == 'SHADER':
-                shader_target = ref_info.get('shader_target', '').lower()
-
-                if shader_target and shader_target in geo_names_in_keep:
-                    shaders_to_move.append(ref)
-                    print(f"  -> Will auto-keep shader: {ref['namespace']} (matches '{shader_target}')")
-
-        # Move shaders to visible list
-        for shader_ref in shaders_to_move:
-            actual_ref = self._safe_remove_ref(shader_ref, self.invisible_references)
-            if actual_ref and not self.is_ref_in_list(actual_ref, self.visible_references):
-                self.visible_references.append(actual_ref)
-
-        print(f"\n✓ Auto-restored {len(shaders_to_move)} shader(s) to keep list")
-        print(f"{'='*60}\n")
-
-    def _find_ref_in_list_by_node(self, ref_data, ref_list):
-        """
-        Find the actual reference object in a list by node value.
-        Returns the actual object from the list, or None if not found.
-        This ensures we get the correct object reference for list operations.
-        """
-        target_node = ref_data['node']
-        for ref in ref_list:
-            if ref['node'] == target_node:
-                return ref
-        return None
+        log.info("✓ Auto-restored %s shader(s) to keep list", restored)
 
-    def _safe_remove_ref(self, ref_data, ref_list):
-        """
-        Safely remove a reference from list by node value, not object identity.
-        Returns the removed reference if successful, None otherwise.
-        """
-        actual_ref = self._find_ref_in_list_by_node(ref_data, ref_list)
-        if actual_ref:
-            ref_list.remove(actual_ref)
-            return actual_ref
-        return None
-    
     def get_ref_from_display_name(self, display_name, ref_list):
         """
         Get the actual reference data from a display name.
         Display name format: "[TYPE] namespace - filename"
         """
+        # Rows currently shown are indexed by update_reference_lists
+        if ref_list is self.visible_references:
+            ref = self._visible_by_display.get(display_name)
+        elif ref_list is self.invisible_references:
+            ref = self._invisible_by_display.get(display_name)
+        else:
+            ref = None
+        if ref is not None:
+            return ref
+        
         # Extract namespace from display name
         # Format: "[SHADER] SDRS_CBDAExtBuildA_Shade - CBDAExtBuildA_rsshade.ma"
         try:
             # Remove the [TYPE] prefix
-            parts = display_name.split('] ', 1)
-            if len(parts) < 2:
+            _, sep, rest = display_name.partition('] ')
+            if not sep:
                 return None
             
             # Get namespace part (before " - ")
-            namespace_part = parts[1].split(' - ')[0].strip()
+            namespace_part = rest.partition(' - ')[0].strip()
             
             # Find matching reference in the list
             for ref in ref_list:
                 if ref['namespace'] == namespace_part:
                     return ref
         except Exception as e:
-            print(f"Error parsing display name '{display_name}': {str(e)}")
+            log.warning("Error parsing display name '%s': %s", display_name, e)
         
         return None
     
@@ -315,16 +470,14 @@ class ReferenceCleanupUI:
             cmds.warning("No geometry selected in Keep list!")
             return
         
-        print(f"\n{'='*60}")
-        print(f"Restoring Shaders for Selected Geometry")
-        print(f"{'='*60}")
+        log.info("Restoring Shaders for Selected Geometry")
         
         selected_geos = []
         for item in selected_items:
             ref_data = self.get_ref_from_display_name(item, self.visible_references)
-            if ref_data and ref_data['ref_type'].get('is_geo', False):
+            if ref_data and ref_data['ref_type'].is_geo:
                 selected_geos.append(ref_data)
-                print(f"\nSelected geo: {ref_data['namespace']}")
+                log.debug("Selected geo: %s", ref_data['namespace'])
         
         if not selected_geos:
             cmds.warning("No geometry references selected!")
@@ -332,20 +485,23 @@ class ReferenceCleanupUI:
         
         # Find all shaders for these geometries
         shaders_to_move = []
+        seen = set()
         
         for geo_ref in selected_geos:
             matching_shaders = self.find_shaders_for_geometry(geo_ref)
             
-            print(f"  Found {len(matching_shaders)} matching shader(s)")
+            log.debug("  Found %s matching shader(s)", len(matching_shaders))
             
             for shader_ref in matching_shaders:
+                node = shader_ref['node']
                 # Check if shader is in invisible list
-                if self.is_ref_in_list(shader_ref, self.invisible_references):
-                    if not self.is_ref_in_list(shader_ref, shaders_to_move):
+                if node in self._invisible_by_node:
+                    if node not in seen:
+                        seen.add(node)
                         shaders_to_move.append(shader_ref)
-                        print(f"    -> Will move: {shader_ref['namespace']}")
+                        log.debug("    -> Will move: %s", shader_ref['namespace'])
                 else:
-                    print(f"    -> Already in keep list: {shader_ref['namespace']}")
+                    log.debug("    -> Already in keep list: %s", shader_ref['namespace'])
         
         if not shaders_to_move:
             cmds.confirmDialog(
@@ -353,15 +509,12 @@ class ReferenceCleanupUI:
                 message='No shaders found in Remove list for selected geometry.\n\nShaders may already be in Keep list.',
                 button=['OK']
             )
-            print("\nNo shaders to move.")
+            log.debug("No shaders to move.")
             return
         
-        # Move shaders to visible list (use safe removal by node value)
-        for shader_ref in shaders_to_move:
-            # Find and remove the actual object from invisible_references by node
-            actual_ref = self._safe_remove_ref(shader_ref, self.invisible_references)
-            if actual_ref and not self.is_ref_in_list(actual_ref, self.visible_references):
-                self.visible_references.append(actual_ref)
+        # Move shaders to visible list (matched by node value)
+        self._move_invisible_to_visible([ref['node'] for ref in shaders_to_move])
+        self._mark_user_moved(shaders_to_move, 'visible')
         
         self.update_reference_lists()
         
@@ -371,43 +524,43 @@ class ReferenceCleanupUI:
             button=['OK']
         )
         
-        print(f"\n✓ Successfully restored {len(shaders_to_move)} shader(s)")
-        print(f"{'='*60}\n")
+        log.info("✓ Successfully restored %s shader(s)", len(shaders_to_move))
     
     def restore_all_shaders(self):
         """
         Go through all geometry in keep list and restore all related shaders from remove list.
         """
-        print(f"\n{'='*60}")
-        print(f"Restoring ALL Shaders for Geometry in Keep List")
-        print(f"{'='*60}")
+        log.info("Restoring ALL Shaders for Geometry in Keep List")
         
-        # Find all geometry in keep list
-        geo_in_keep = [ref for ref in self.visible_references if ref['ref_type'].get('is_geo', False)]
+        # Geo names in keep list
+        geo_count, geo_names_in_keep = self._keep_geo_names()
         
-        if not geo_in_keep:
+        if not geo_count:
             cmds.warning("No geometry in Keep list!")
             return
         
-        print(f"\nFound {len(geo_in_keep)} geometry reference(s) in keep list")
+        log.debug("Found %s geometry reference(s) in keep list", geo_count)
         
         # Find all shaders that should be kept
         shaders_to_move = []
+        seen = set()
         
-        for geo_ref in geo_in_keep:
-            print(f"\nChecking geo: {geo_ref['namespace']}")
-            matching_shaders = self.find_shaders_for_geometry(geo_ref)
+        for geo_name in geo_names_in_keep:
+            log.debug("Checking geo: %s", geo_name)
+            matching_shaders = self._shaders_by_target.get(geo_name, [])
             
-            print(f"  Found {len(matching_shaders)} matching shader(s)")
+            log.debug("  Found %s matching shader(s)", len(matching_shaders))
             
             for shader_ref in matching_shaders:
+                node = shader_ref['node']
                 # Check if shader is in invisible list
-                if self.is_ref_in_list(shader_ref, self.invisible_references):
-                    if not self.is_ref_in_list(shader_ref, shaders_to_move):
+                if node in self._invisible_by_node:
+                    if node not in seen:
+                        seen.add(node)
                         shaders_to_move.append(shader_ref)
-                        print(f"    -> Will move: {shader_ref['namespace']}")
+                        log.debug("    -> Will move: %s", shader_ref['namespace'])
                 else:
-                    print(f"    -> Already in keep list: {shader_ref['namespace']}")
+                    log.debug("    -> Already in keep list: %s", shader_ref['namespace'])
         
         if not shaders_to_move:
             cmds.confirmDialog(
@@ -415,15 +568,12 @@ class ReferenceCleanupUI:
                 message='All shaders for geometry in Keep list are already in Keep list.',
                 button=['OK']
             )
-            print("\nNo shaders to move - all already in keep list.")
+            log.debug("No shaders to move - all already in keep list.")
             return
         
-        # Move shaders to visible list (use safe removal by node value)
-        for shader_ref in shaders_to_move:
-            # Find and remove the actual object from invisible_references by node
-            actual_ref = self._safe_remove_ref(shader_ref, self.invisible_references)
-            if actual_ref and not self.is_ref_in_list(actual_ref, self.visible_references):
-                self.visible_references.append(actual_ref)
+        # Move shaders to visible list (matched by node value)
+        self._move_invisible_to_visible([ref['node'] for ref in shaders_to_move])
+        self._mark_user_moved(shaders_to_move, 'visible')
         
         self.update_reference_lists()
         
@@ -433,8 +583,7 @@ class ReferenceCleanupUI:
             button=['OK']
         )
         
-        print(f"\n✓ Successfully restored {len(shaders_to_move)} shader(s)")
-        print(f"{'='*60}\n")
+        log.info("✓ Successfully restored %s shader(s)", len(shaders_to_move))
         
     def create_ui(self):
         """Create the main UI window"""
@@ -488,6 +637,12 @@ class ReferenceCleanupUI:
             wordWrap=True
         )
         
+        cmds.checkBox(
+            label="Verbose Log (Script Editor)",
+            value=log.isEnabledFor(logging.DEBUG),
+            changeCommand=self.set_verbose
+        )
+        
         cmds.setParent('..')
         cmds.separator(height=10)
         
@@ -536,6 +691,13 @@ class ReferenceCleanupUI:
         self.vis_filter_prop = cmds.checkBox(label='PROP', value=True, changeCommand=lambda x: self.update_filters('visible'))
         self.vis_filter_other = cmds.checkBox(label='OTHER', value=True, changeCommand=lambda x: self.update_filters('visible'))
         cmds.setParent('..')
+        self._vis_filters = [
+            ('GEO', self.vis_filter_geo),
+            ('SHADER', self.vis_filter_shader),
+            ('CHAR', self.vis_filter_char),
+            ('PROP', self.vis_filter_prop),
+            ('OTHER', self.vis_filter_other),
+        ]
         
         cmds.separator(height=5, style='none')
         
@@ -584,6 +746,13 @@ class ReferenceCleanupUI:
         self.inv_filter_prop = cmds.checkBox(label='PROP', value=True, changeCommand=lambda x: self.update_filters('invisible'))
         self.inv_filter_other = cmds.checkBox(label='OTHER', value=True, changeCommand=lambda x: self.update_filters('invisible'))
         cmds.setParent('..')
+        self._inv_filters = [
+            ('GEO', self.inv_filter_geo),
+            ('SHADER', self.inv_filter_shader),
+            ('CHAR', self.inv_filter_char),
+            ('PROP', self.inv_filter_prop),
+            ('OTHER', self.inv_filter_other),
+        ]
         
         cmds.separator(height=5, style='none')
         
@@ -609,6 +778,9 @@ class ReferenceCleanupUI:
             selectCommand=lambda: self.on_list_select('invisible')
         )
         cmds.setParent('..')
+        # Fresh widgets start empty
+        self._visible_display = []
+        self._invisible_display = []
         
         cmds.tabLayout(
             self.tab_layout, 
@@ -669,46 +841,30 @@ class ReferenceCleanupUI:
     def update_padding(self, value):
         self.frustum_padding = value
     
+    def set_verbose(self, value):
+        log.setLevel(logging.DEBUG if value else logging.WARNING)
+    
     def update_filters(self, list_type):
         """Update filter states and refresh display"""
         if list_type == 'visible':
-            self.filter_visible['GEO'] = cmds.checkBox(self.vis_filter_geo, query=True, value=True)
-            self.filter_visible['SHADER'] = cmds.checkBox(self.vis_filter_shader, query=True, value=True)
-            self.filter_visible['CHAR'] = cmds.checkBox(self.vis_filter_char, query=True, value=True)
-            self.filter_visible['PROP'] = cmds.checkBox(self.vis_filter_prop, query=True, value=True)
-            self.filter_visible['OTHER'] = cmds.checkBox(self.vis_filter_other, query=True, value=True)
+            filters, handles = self.filter_visible, self._vis_filters
         else:
-            self.filter_invisible['GEO'] = cmds.checkBox(self.inv_filter_geo, query=True, value=True)
-            self.filter_invisible['SHADER'] = cmds.checkBox(self.inv_filter_shader, query=True, value=True)
-            self.filter_invisible['CHAR'] = cmds.checkBox(self.inv_filter_char, query=True, value=True)
-            self.filter_invisible['PROP'] = cmds.checkBox(self.inv_filter_prop, query=True, value=True)
-            self.filter_invisible['OTHER'] = cmds.checkBox(self.inv_filter_other, query=True, value=True)
+            filters, handles = self.filter_invisible, self._inv_filters
         
-        self.update_reference_lists()
-    
-    def should_show_reference(self, ref_data, list_type):
-        """Check if reference should be shown based on filters"""
-        filters = self.filter_visible if list_type == 'visible' else self.filter_invisible
-        ref_info = ref_data['ref_type']
-        display_type = ref_info['display_type']
-        
-        if display_type == 'SHADER':
-            return filters['SHADER']
-        elif display_type in ['CHAR']:
-            return filters['CHAR']
-        elif display_type in ['PROP']:
-            return filters['PROP']
-        elif display_type in ['GEO', 'SET']:
-            return filters['GEO']
+        filters.update({key: cmds.checkBox(h, query=True, value=True) for key, h in handles})
+        mask = _filter_mask(filters)
+        if list_type == 'visible':
+            self._vis_mask = mask
         else:
-            return filters['OTHER']
+            self._inv_mask = mask
+        
+        self.update_reference_lists()
     
     def select_all_visible(self, select_state):
         """Select or deselect all items in visible list"""
         if select_state:
-            all_items = cmds.textScrollList(self.visible_list, query=True, allItems=True) or []
-            for item in all_items:
-                cmds.textScrollList(self.visible_list, edit=True, selectItem=item)
+            if self._visible_display:
+                cmds.textScrollList(self.visible_list, edit=True, selectItem=self._visible_display)
         else:
             cmds.textScrollList(self.visible_list, edit=True, deselectAll=True)
     
@@ -725,11 +881,9 @@ class ReferenceCleanupUI:
             if ref_data:
                 refs_to_move.append(ref_data)
         
-        # Move references (use safe removal by node value)
-        for ref in refs_to_move:
-            actual_ref = self._safe_remove_ref(ref, self.visible_references)
-            if actual_ref and not self.is_ref_in_list(actual_ref, self.invisible_references):
-                self.invisible_references.append(actual_ref)
+        # Move references (matched by node value)
+        self._move_visible_to_invisible([ref['node'] for ref in refs_to_move])
+        self._mark_user_moved(refs_to_move, 'invisible')
         
         self.update_reference_lists()
         print(f"Moved {len(refs_to_move)} reference(s) to Remove list")
@@ -747,11 +901,9 @@ class ReferenceCleanupUI:
             if ref_data:
                 refs_to_move.append(ref_data)
         
-        # Move references (use safe removal by node value)
-        for ref in refs_to_move:
-            actual_ref = self._safe_remove_ref(ref, self.invisible_references)
-            if actual_ref and not self.is_ref_in_list(actual_ref, self.visible_references):
-                self.visible_references.append(actual_ref)
+        # Move references (matched by node value)
+        self._move_invisible_to_visible([ref['node'] for ref in refs_to_move])
+        self._mark_user_moved(refs_to_move, 'visible')
         
         self.update_reference_lists()
         print(f"Moved {len(refs_to_move)} reference(s) to Keep list")
@@ -807,7 +959,7 @@ class ReferenceCleanupUI:
             right = om2.MVector(mat[0], mat[1], mat[2]).normalize()
             up = om2.MVector(mat[4], mat[5], mat[6]).normalize()
             
-            return {
+            frustum = {
                 'position': cam_pos,
                 'forward': forward,
                 'right': right,
@@ -815,11 +967,20 @@ class ReferenceCleanupUI:
                 'h_fov': h_fov,
                 'v_fov': v_fov,
                 'near_clip': near_clip,
-                'far_clip': far_clip
+                'far_clip': far_clip,
+                # Padded half-FOV tangents, constant for the whole scan
+                'tan_half_h': math.tan(h_fov / 2.0) * self.frustum_padding,
+                'tan_half_v': math.tan(v_fov / 2.0) * self.frustum_padding
             }
+            if NUMPY_AVAILABLE:
+                # Same basis as (3,) float64 arrays for the batched cull
+                for key in ('position', 'forward', 'right', 'up'):
+                    vec = frustum[key]
+                    frustum['np_' + key] = np.array((vec.x, vec.y, vec.z), dtype=np.float64)
+            return frustum
             
         except Exception as e:
-            print(f"Error getting camera frustum: {str(e)}")
+            log.warning("Error getting camera frustum: %s", e)
             return None
     
     def is_bbox_in_frustum(self, bbox, frustum):
@@ -827,31 +988,50 @@ class ReferenceCleanupUI:
             return False
         
         try:
-            corners = [
-                om2.MVector(bbox[0], bbox[1], bbox[2]),
-                om2.MVector(bbox[3], bbox[1], bbox[2]),
-                om2.MVector(bbox[0], bbox[4], bbox[2]),
-                om2.MVector(bbox[3], bbox[4], bbox[2]),
-                om2.MVector(bbox[0], bbox[1], bbox[5]),
-                om2.MVector(bbox[3], bbox[1], bbox[5]),
-                om2.MVector(bbox[0], bbox[4], bbox[5]),
-                om2.MVector(bbox[3], bbox[4], bbox[5])
-            ]
+            # Unpack once; the corner loop is plain float arithmetic
+            pos = frustum['position']
+            fwd = frustum['forward']
+            right = frustum['right']
+            up = frustum['up']
+            px, py, pz = pos.x, pos.y, pos.z
+            fx, fy, fz = fwd.x, fwd.y, fwd.z
+            rx, ry, rz = right.x, right.y, right.z
+            ux, uy, uz = up.x, up.y, up.z
+            near_clip = frustum['near_clip']
+            far_clip = frustum['far_clip']
+            tan_half_h = frustum['tan_half_h']
+            tan_half_v = frustum['tan_half_v']
+            
+            # Bounding-sphere pre-check: every corner lies within `radius` of
+            # the center, so these rejects can never drop a box the corner
+            # test would accept
+            dx = (bbox[0] + bbox[3]) * 0.5 - px
+            dy = (bbox[1] + bbox[4]) * 0.5 - py
+            dz = (bbox[2] + bbox[5]) * 0.5 - pz
+            radius = 0.5 * math.sqrt(
+                (bbox[3] - bbox[0]) ** 2 + (bbox[4] - bbox[1]) ** 2 + (bbox[5] - bbox[2]) ** 2
+            )
+            forward_dist = dx * fx + dy * fy + dz * fz
+            if forward_dist + radius < near_clip or forward_dist - radius > far_clip:
+                return False
+            if abs(dx * rx + dy * ry + dz * rz) - radius > (forward_dist + radius) * tan_half_h:
+                return False
+            if abs(dx * ux + dy * uy + dz * uz) - radius > (forward_dist + radius) * tan_half_v:
+                return False
             
-            for corner in corners:
-                to_corner = corner - frustum['position']
-                forward_dist = to_corner * frustum['forward']
+            for ix, iy, iz in _BBOX_CORNER_IDX:
+                dx = bbox[ix] - px
+                dy = bbox[iy] - py
+                dz = bbox[iz] - pz
+                forward_dist = dx * fx + dy * fy + dz * fz
                 
-                if forward_dist < frustum['near_clip'] or forward_dist > frustum['far_clip']:
+                if forward_dist < near_clip or forward_dist > far_clip:
                     continue
                 
-                right_dist = to_corner * frustum['right']
-                up_dist = to_corner * frustum['up']
+                right_dist = dx * rx + dy * ry + dz * rz
+                up_dist = dx * ux + dy * uy + dz * uz
                 
-                half_width = forward_dist * math.tan(frustum['h_fov'] / 2.0) * self.frustum_padding
-                half_height = forward_dist * math.tan(frustum['v_fov'] / 2.0) * self.frustum_padding
-                
-                if abs(right_dist) <= half_width and abs(up_dist) <= half_height:
+                if abs(right_dist) <= forward_dist * tan_half_h and abs(up_dist) <= forward_dist * tan_half_v:
                     return True
             
             return False
@@ -859,6 +1039,52 @@ class ReferenceCleanupUI:
         except Exception as e:
             return False
     
+    def _bboxes_in_frustum_batch(self, bboxes, frustum):
+        """
+        Vectorized is_bbox_in_frustum over an (N, 6) array of world
+        [min xyz, max xyz] boxes. Returns an (N,) bool array.
+        """
+        pos = frustum['np_position']
+        fwd = frustum['np_forward']
+        right = frustum['np_right']
+        up = frustum['np_up']
+        tan_h = frustum['tan_half_h']
+        tan_v = frustum['tan_half_v']
+        
+        near_clip = frustum['near_clip']
+        far_clip = frustum['far_clip']
+        
+        # Conservative bounding-sphere reject (see is_bbox_in_frustum); only
+        # the survivors go through the 8-corner test
+        centers = (bboxes[:, :3] + bboxes[:, 3:]) * 0.5 - pos
+        radius = 0.5 * np.linalg.norm(bboxes[:, 3:] - bboxes[:, :3], axis=1)
+        center_fd = centers @ fwd
+        reach = center_fd + radius
+        maybe = (
+            (reach >= near_clip)
+            & (center_fd - radius <= far_clip)
+            & (np.abs(centers @ right) - radius <= reach * tan_h)
+            & (np.abs(centers @ up) - radius <= reach * tan_v)
+        )
+        result = np.zeros(len(bboxes), dtype=bool)
+        if not maybe.any():
+            return result
+        
+        # (M, 8, 3) corners relative to the camera
+        corners = bboxes[maybe][:, list(_BBOX_CORNER_IDX)] - pos
+        forward_dist = corners @ fwd
+        right_dist = corners @ right
+        up_dist = corners @ up
+        
+        valid = (
+            (forward_dist >= near_clip)
+            & (forward_dist <= far_clip)
+            & (np.abs(right_dist) <= forward_dist * tan_h)
+            & (np.abs(up_dist) <= forward_dist * tan_v)
+        )
+        result[maybe] = valid.any(axis=1)
+        return result
+    
     def get_visible_objects_in_camera(self):
         if not self.selected_camera:
             return []
@@ -868,68 +1094,72 @@ class ReferenceCleanupUI:
             if not frustum:
                 return []
             
-            print(f"\nCamera Frustum Info:")
-            print(f"  H-FOV: {math.degrees(frustum['h_fov']):.2f}°")
-            print(f"  V-FOV: {math.degrees(frustum['v_fov']):.2f}°")
-            print(f"  Padding: {self.frustum_padding}")
+            log.debug("Camera Frustum Info:")
+            log.debug("  H-FOV: %.2f°", math.degrees(frustum['h_fov']))
+            log.debug("  V-FOV: %.2f°", math.degrees(frustum['v_fov']))
+            log.debug("  Padding: %s", self.frustum_padding)
             
-            all_meshes = cmds.ls(type='mesh', long=True)
-            visible_objects = []
+            candidates = []
+            bboxes = []
             
-            for mesh in all_meshes:
-                transforms = cmds.listRelatives(mesh, parent=True, fullPath=True)
-                if not transforms:
-                    continue
-                
-                transform = transforms[0]
+            # Walk mesh shapes through the API instead of per-node cmds calls
+            it = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kMesh)
+            while not it.isDone():
+                shape_path = it.getPath()
+                it.next()
                 
                 try:
-                    if not cmds.getAttr(transform + '.visibility'):
+                    # One native call covers visibility on the whole ancestor
+                    # chain; checked before any function set is built
+                    if not shape_path.isVisible():
                         continue
                     
-                    parent = transform
-                    is_visible = True
-                    while parent:
-                        try:
-                            if not cmds.getAttr(parent + '.visibility'):
-                                is_visible = False
-                                break
-                        except:
-                            pass
-                        
-                        parents = cmds.listRelatives(parent, parent=True, fullPath=True)
-                        parent = parents[0] if parents else None
-                    
-                    if not is_visible:
+                    shape_fn = om2.MFnDagNode(shape_path)
+                    if shape_fn.isIntermediateObject:
                         continue
                     
-                    if cmds.getAttr(mesh + '.intermediateObject'):
-                        continue
-                    
-                    if cmds.getAttr(transform + '.overrideEnabled'):
-                        display_type = cmds.getAttr(transform + '.overrideDisplayType')
+                    transform_path = om2.MDagPath(shape_path)
+                    transform_path.pop()
+                    transform_fn = om2.MFnDagNode(transform_path)
+                    if transform_fn.findPlug('overrideEnabled', False).asBool():
+                        display_type = transform_fn.findPlug('overrideDisplayType', False).asInt()
                         if display_type in [1, 2]:
                             continue
                     
-                    try:
-                        bbox = cmds.exactWorldBoundingBox(transform)
-                    except:
-                        continue
-                    
-                    if self.is_bbox_in_frustum(bbox, frustum):
-                        visible_objects.append(transform)
+                    bbox = shape_fn.boundingBox
+                    bbox.transformUsingMatrix(shape_path.inclusiveMatrix())
+                    bb_min, bb_max = bbox.min, bbox.max
+                    # Leaf name captured here so nothing re-splits the path later
+                    candidates.append((transform_path.fullPathName(), transform_fn.name()))
+                    bboxes.append((bb_min.x, bb_min.y, bb_min.z, bb_max.x, bb_max.y, bb_max.z))
                     
                 except:
                     continue
             
-            print(f"Found {len(visible_objects)} visible mesh objects in frustum")
+            # Cull all surviving bboxes in one pass
+            if NUMPY_AVAILABLE and bboxes:
+                in_frustum = self._bboxes_in_frustum_batch(np.array(bboxes, dtype=np.float64), frustum)
+                hits = [c for c, hit in zip(candidates, in_frustum) if hit]
+            else:
+                hits = [c for c, bbox in zip(candidates, bboxes) if self.is_bbox_in_frustum(bbox, frustum)]
+            # A transform with several mesh shapes is listed once
+            self._leaf_by_path = dict(hits)
+            visible_objects = list(self._leaf_by_path)
+            
+            log.info("Found %s visible mesh objects in frustum", len(visible_objects))
             return visible_objects
             
         except Exception as e:
-            print(f"Error getting visible objects: {str(e)}")
+            log.warning("Error getting visible objects: %s", e)
             return []
     
-    def scan_references(self, *args):
+    def scan_references(self, *args, incremental=False):
+        """
+        Classify every reference against the camera frustum. With
+        incremental=True (Refresh), refs the user moved by hand keep their
+        list; a full scan forgets them. The frustum pass always re-runs,
+        since Refresh is what users press after editing the scene.
+        """
         if not self.selected_camera:
             cmds.warning("Please select a camera first!")
             return
@@ -944,122 +1174,168 @@ class ReferenceCleanupUI:
             cmds.warning("No references found in scene!")
             return
         
-        print(f"\n{'='*60}")
-        print(f"Scanning {len(all_refs)} references...")
-        print(f"{'='*60}")
-        
-        visible_objects = self.get_visible_objects_in_camera()
-        
-        self.all_references = []
-        self.visible_references = []
-        self.invisible_references = []
+        log.info("Scanning %s references...", len(all_refs))
+
+        # Hold viewport redraws until the scan and list rebuild are done
+        cmds.refresh(suspend=True)
+        try:
+            if not incremental:
+                self._user_placement = {}
+            visible_objects = self.get_visible_objects_in_camera()
+            # Hash lookups for the per-reference membership tests below
+            visible_set = set(visible_objects)
+            visible_by_ns = _index_by_namespace(
+                {path: self._leaf_by_path.get(path) or path.rpartition('|')[2] for path in visible_objects}
+            )
         
-        # Scan and categorize all references
-        for ref in all_refs:
-            try:
-                ref_file = cmds.referenceQuery(ref, filename=True, withoutCopyNumber=True)
-                ref_namespace = cmds.referenceQuery(ref, namespace=True)
+            self.all_references = []
+            self.visible_references = []
+            self.invisible_references = []
+            self._visible_by_node = {}
+            self._invisible_by_node = {}
+            self._vis_generation += 1
+            _parse_ns.cache_clear()
+            pending = []
+        
+            # Scan and categorize all references
+            for ref in all_refs:
+                try:
+                    ref_file = cmds.referenceQuery(ref, filename=True, withoutCopyNumber=True)
+                    ref_namespace = cmds.referenceQuery(ref, namespace=True)
                 
-                ref_data = {
-                    'node': ref,
-                    'file': ref_file,
-                    'namespace': ref_namespace,
-                    'short_name': ref_file.split('/')[-1]
-                }
+                    ref_data = {
+                        'node': ref,
+                        'file': ref_file,
+                        'namespace': ref_namespace,
+                        'short_name': ref_file.split('/')[-1]
+                    }
                 
-                # Parse reference type
-                ref_data['ref_type'] = self.parse_reference_type(ref_data)
+                    # Parse reference type
+                    ref_type = ref_data['ref_type'] = self.parse_reference_type(ref_data)
                 
-                self.all_references.append(ref_data)
+                    self.all_references.append(ref_data)
                 
-                # Skip cameras - always keep
-                if ref_data['ref_type']['type'] == 'CAMERA':
-                    self.visible_references.append(ref_data)
-                    print(f"  [CAMERA] {ref_namespace} - always kept")
-                    continue
+                    # Manual moves survive a refresh
+                    placed = self._user_placement.get(ref)
+                    if placed is not None:
+                        if placed == 'visible':
+                            self._add_visible(ref_data)
+                        else:
+                            self._add_invisible(ref_data)
+                        log.debug("  [USER] %s - kept in %s list", ref_namespace, placed)
+                        continue
+                
+                    # Skip cameras - always keep
+                    if ref_type.type is _CAT_CAMERA:
+                        self._add_visible(ref_data)
+                        log.debug("  [CAMERA] %s - always kept", ref_namespace)
+                        continue
                 
-                # For GEOMETRY only, check frustum visibility
-                if ref_data['ref_type'].get('is_geo', False):
-                    ref_nodes = cmds.referenceQuery(ref, nodes=True, dagPath=True)
-                    is_visible = False
+                    # For GEOMETRY only, check frustum visibility
+                    if ref_type.is_geo:
+                        # A visible transform in this reference's own namespace
+                        # settles it without walking any descendants
+                        is_visible = bool(visible_by_ns.get(ref_namespace.strip(':')))
+                        ref_nodes = ()
+                        if not is_visible:
+                            # Kept on ref_data so select_reference_in_scene can reuse it
+                            ref_nodes = ref_data['_nodes'] = cmds.referenceQuery(ref, nodes=True, dagPath=True) or []
                     
-                    for ref_node in ref_nodes:
-                        if ref_node in visible_objects:
-                            is_visible = True
-                            break
+                        for ref_node in ref_nodes:
+                            if ref_node in visible_set:
+                                is_visible = True
+                                break
                         
-                        try:
-                            children = cmds.listRelatives(ref_node, allDescendents=True, fullPath=True, type='transform') or []
-                            for child in children:
-                                if child in visible_objects:
-                                    is_visible = True
-                                    break
-                        except:
-                            pass
+                            try:
+                                children = cmds.listRelatives(ref_node, allDescendents=True, fullPath=True, type='transform') or []
+                                for child in children:
+                                    if child in visible_set:
+                                        is_visible = True
+                                        break
+                            except:
+                                pass
                         
-                        if is_visible:
-                            break
+                            if is_visible:
+                                break
                     
-                    if is_visible:
-                        self.visible_references.append(ref_data)
-                        print(f"  [GEO-KEEP] {ref_namespace} - visible in frustum")
+                        if is_visible:
+                            self._add_visible(ref_data)
+                            log.debug("  [GEO-KEEP] %s - visible in frustum", ref_namespace)
+                        else:
+                            self._add_invisible(ref_data)
+                            log.debug("  [GEO-REMOVE] %s - not in frustum", ref_namespace)
                     else:
-                        self.invisible_references.append(ref_data)
-                        print(f"  [GEO-REMOVE] {ref_namespace} - not in frustum")
-                else:
-                    # Non-geometry (shaders, etc.) - add to invisible for now
-                    # They will be auto-restored after geometry scan is complete
-                    self.invisible_references.append(ref_data)
-                    print(f"  [{ref_data['ref_type']['type']}] {ref_namespace} - pending shader matching")
+                        # Non-geometry (shaders, etc.) - held back until every
+                        # geometry decision is known, then placed in one pass
+                        pending.append(ref_data)
+                        log.debug("  [%s] %s - pending shader matching", ref_type.type, ref_namespace)
 
-            except Exception as e:
-                print(f"Error processing reference {ref}: {str(e)}")
-                continue
+                except Exception as e:
+                    log.warning("Error processing reference %s: %s", ref, e)
+                    continue
 
-        # AUTO-RESTORE SHADERS: Find shaders that match geometry in keep list
-        self._auto_restore_matching_shaders()
+            self._build_name_indexes()
 
-        self.update_reference_lists()
+            # AUTO-RESTORE SHADERS: Keep shaders that match geometry in keep list
+            self._auto_restore_matching_shaders(pending)
+
+            self.update_reference_lists()
+        finally:
+            cmds.refresh(suspend=False)
 
         status_msg = f"Status: {len(self.visible_references)} to keep, {len(self.invisible_references)} to remove"
         cmds.text(self.scan_status, edit=True, label=status_msg)
 
-        print(f"\n{'='*60}")
-        print(f"Scan Complete:")
-        print(f"  Total: {len(self.all_references)}")
-        print(f"  Keep: {len(self.visible_references)} (geometry + matching shaders)")
-        print(f"  Remove: {len(self.invisible_references)}")
-        print(f"{'='*60}\n")
+        log.info("Scan Complete:")
+        log.info("  Total: %s", len(self.all_references))
+        log.info("  Keep: %s (geometry + matching shaders)", len(self.visible_references))
+        log.info("  Remove: %s", len(self.invisible_references))
     
     def update_reference_lists(self):
-        cmds.textScrollList(self.visible_list, edit=True, removeAll=True)
-        cmds.textScrollList(self.invisible_list, edit=True, removeAll=True)
-        
-        cmds.text(self.total_refs_text, edit=True, label=f"Total: {len(self.all_references)}")
-        cmds.text(self.visible_refs_text, edit=True, label=f"Keep: {len(self.visible_references)}")
-        cmds.text(self.invisible_refs_text, edit=True, label=f"Remove: {len(self.invisible_references)}")
-        
-        # Populate visible list with filtering
-        for ref_data in self.visible_references:
-            if self.should_show_reference(ref_data, 'visible'):
-                ref_info = ref_data['ref_type']
-                display_name = f"[{ref_info['display_type']}] {ref_data['namespace']} - {ref_data['short_name']}"
-                cmds.textScrollList(self.visible_list, edit=True, append=display_name)
-        
-        # Populate invisible list with filtering
-        for ref_data in self.invisible_references:
-            if self.should_show_reference(ref_data, 'invisible'):
-                ref_info = ref_data['ref_type']
-                display_name = f"[{ref_info['display_type']}] {ref_data['namespace']} - {ref_data['short_name']}"
-                cmds.textScrollList(self.invisible_list, edit=True, append=display_name)
+        cmds.waitCursor(state=True)
+        try:
+            cmds.text(self.total_refs_text, edit=True, label=f"Total: {len(self.all_references)}")
+            cmds.text(self.visible_refs_text, edit=True, label=f"Keep: {len(self.visible_references)}")
+            cmds.text(self.invisible_refs_text, edit=True, label=f"Remove: {len(self.invisible_references)}")
+            
+            # Build each filtered list in Python, then hand it to Maya in one call
+            for list_widget, ref_list, list_type in (
+                (self.visible_list, self.visible_references, 'visible'),
+                (self.invisible_list, self.invisible_references, 'invisible'),
+            ):
+                display_names = []
+                by_display = {}
+                # Filter-bit test against this list's mask, hoisted out of the loop
+                mask = self._vis_mask if list_type == 'visible' else self._inv_mask
+                for ref_data in ref_list:
+                    ref_info = ref_data['ref_type']
+                    if ref_info.filter_bit & mask:
+                        display_name = f"[{ref_info.display_type}] {ref_data['namespace']} - {ref_data['short_name']}"
+                        display_names.append(display_name)
+                        by_display.setdefault(display_name, ref_data)
+                
+                if list_type == 'visible':
+                    self._visible_by_display = by_display
+                    previous, self._visible_display = self._visible_display, display_names
+                else:
+                    self._invisible_by_display = by_display
+                    previous, self._invisible_display = self._invisible_display, display_names
+                
+                # The Python list is authoritative; touch the widget only on change
+                if display_names == previous:
+                    continue
+                cmds.textScrollList(list_widget, edit=True, removeAll=True)
+                if display_names:
+                    cmds.textScrollList(list_widget, edit=True, append=display_names)
+        finally:
+            cmds.waitCursor(state=False)
         
         self.update_remove_count()
     
     def select_all_invisible(self, select_state):
         if select_state:
-            all_items = cmds.textScrollList(self.invisible_list, query=True, allItems=True) or []
-            for item in all_items:
-                cmds.textScrollList(self.invisible_list, edit=True, selectItem=item)
+            if self._invisible_display:
+                cmds.textScrollList(self.invisible_list, edit=True, selectItem=self._invisible_display)
         else:
             cmds.textScrollList(self.invisible_list, edit=True, deselectAll=True)
         
@@ -1082,36 +1358,43 @@ class ReferenceCleanupUI:
 
         # Determine which list and reference data to use
         if list_type == 'visible':
-            ref_list = self.visible_references
+            by_display = self._visible_by_display
             list_widget = self.visible_list
         else:
-            ref_list = self.invisible_references
+            by_display = self._invisible_by_display
             list_widget = self.invisible_list
 
-        # Get all items currently in the list (respects filters)
-        all_list_items = cmds.textScrollList(list_widget, query=True, allItems=True) or []
-
-        # Build a mapping of namespace -> display_name
+        # Build a mapping of namespace -> display_name over the rows
+        # currently in the list (respects filters)
         namespace_to_display = {}
-        for ref_data in ref_list:
-            ref_info = ref_data['ref_type']
-            display_name = f"[{ref_info['display_type']}] {ref_data['namespace']} - {ref_data['short_name']}"
-            if display_name in all_list_items:
-                namespace_to_display[ref_data['namespace'].strip(':')] = display_name
+        for display_name, ref_data in by_display.items():
+            namespace_to_display[ref_data['namespace'].strip(':')] = display_name
+
+        # One anchored alternation, longest namespace first so nested
+        # namespaces win over their parents
+        ns_pattern = None
+        if namespace_to_display:
+            alts = sorted(namespace_to_display, key=len, reverse=True)
+            ns_pattern = re.compile(r'^(' + '|'.join(re.escape(ns) for ns in alts) + r')(?:[:_]|$)')
 
         # Find matching references for selected objects
         items_to_select = set()
         matched_count = 0
 
-        for obj in viewport_selection:
-            # Extract namespace from object path
-            # Object path might be: |SETS_CentralBusinessDistrictAExt_001:CBDAExtBuildB_003:CBDAExtBuildBADoorB_Geo
-            obj_name = obj.split('|')[-1]  # Get the leaf node name
+        # Leaf node names, split once
+        # Object path might be: |SETS_CentralBusinessDistrictAExt_001:CBDAExtBuildB_003:CBDAExtBuildBADoorB_Geo
+        leaves = [obj.rpartition('|')[2] for obj in viewport_selection]
 
-            # Try to find matching namespace
+        for obj_name in leaves:
+            match = ns_pattern.match(obj_name) if ns_pattern else None
+            if match:
+                items_to_select.add(namespace_to_display[match.group(1)])
+                matched_count += 1
+                continue
+
+            # Fallback: namespace appearing anywhere in the name
             for ns, display_name in namespace_to_display.items():
-                # Check if object starts with or contains this namespace
-                if obj_name.startswith(ns + ':') or obj_name.startswith(ns + '_') or ns in obj_name:
+                if ns in obj_name:
                     items_to_select.add(display_name)
                     matched_count += 1
                     break
@@ -1123,12 +1406,15 @@ class ReferenceCleanupUI:
         # Deselect all first
         cmds.textScrollList(list_widget, edit=True, deselectAll=True)
 
-        # Select matching items
-        for item in items_to_select:
-            try:
-                cmds.textScrollList(list_widget, edit=True, selectItem=item)
-            except Exception as e:
-                print(f"Could not select item: {item} - {str(e)}")
+        # Select matching items in one edit; fall back per item to report misses
+        try:
+            cmds.textScrollList(list_widget, edit=True, selectItem=list(items_to_select))
+        except Exception:
+            for item in items_to_select:
+                try:
+                    cmds.textScrollList(list_widget, edit=True, selectItem=item)
+                except Exception as e:
+                    print(f"Could not select item: {item} - {str(e)}")
 
         print(f"Selected {len(items_to_select)} reference(s) in {'Keep' if list_type == 'visible' else 'Remove'} list from viewport selection")
 
@@ -1151,8 +1437,11 @@ class ReferenceCleanupUI:
             ref_data = self.get_ref_from_display_name(item, ref_list)
             if ref_data:
                 try:
-                    ref_nodes = cmds.referenceQuery(ref_data['node'], nodes=True)
-                    transforms = [n for n in ref_nodes if cmds.nodeType(n) == 'transform']
+                    ref_nodes = ref_data.get('_nodes')
+                    if ref_nodes is None:
+                        ref_nodes = ref_data['_nodes'] = cmds.referenceQuery(ref_data['node'], nodes=True, dagPath=True) or []
+                    # One ls filters the type (and drops nodes deleted since the scan)
+                    transforms = cmds.ls(ref_nodes, type='transform', long=True) if ref_nodes else []
                     if transforms:
                         nodes_to_select.extend(transforms[:5])  # Select first 5 transforms
                 except:
@@ -1200,8 +1489,8 @@ class ReferenceCleanupUI:
         removed_count = 0
         failed_refs = []
         
-        # Build a set of nodes we want to KEEP (to prevent accidental removal)
-        keep_nodes = {ref['node'] for ref in self.visible_references}
+        # Nodes we want to KEEP (to prevent accidental removal)
+        keep_nodes = self._visible_by_node
 
         for ref_data in refs_to_remove:
             ref_node = ref_data['node']
@@ -1240,7 +1529,7 @@ class ReferenceCleanupUI:
     
     def refresh_lists(self, *args):
         if self.selected_camera:
-            self.scan_references()
+            self.scan_references(incremental=True)
         else:
             cmds.warning("Please select a camera first!")
     
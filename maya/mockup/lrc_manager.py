@@ -30,9 +30,12 @@ import os
 import re
 import json
 import shutil
-import subprocess
-import glob
-from collections import OrderedDict
+import time
+import heapq
+from collections import OrderedDict, namedtuple
+from operator import attrgetter
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 try:
@@ -78,96 +81,205 @@ except ImportError:
         print("Warning: shiboken not available")
         wrapInstance = None
 
+# Try to import orjson for faster JSON info/template files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# Version token in versioned file names (shared by every VersionManager)
+_VERSION_RE = re.compile(r'v(\d{3,4})')
+# Scene file extensions (without the dot) accepted in version dirs
+_MAYA_SCENE_EXTS = frozenset(('ma', 'mb'))
+# Characters re.escape() escapes (all ASCII), taken from the running re module
+_REGEX_SPECIALS = {ch: re.escape(ch) for ch in map(chr, range(128)) if re.escape(ch) != ch}
+
+
+def _build_dag_regex_table(escape_special, use_wildcards):
+    """str.translate table for one (escape_special, use_wildcards) option pair"""
+    table = dict(_REGEX_SPECIALS) if escape_special else {}
+    if escape_special:
+        # DAG separator and '*' stay literal regex syntax
+        table['|'] = '|'
+        table['*'] = '*'
+    if use_wildcards:
+        table['*'] = '.*'
+        # An escaped '?' historically came out as '\.' after wildcard conversion
+        table['?'] = r'\.' if escape_special else '.'
+    return str.maketrans(table)
+
+
+# One-pass DAG path -> regex tables keyed by (escape_special, use_wildcards)
+_DAG_REGEX_TABLES = {
+    (escape, wildcards): _build_dag_regex_table(escape, wildcards)
+    for escape in (False, True) for wildcards in (False, True)
+}
+
+# Lightweight file records (tuples; converted to dicts only at the Qt boundary)
+VersionInfo = namedtuple('VersionInfo', 'file version path size mtime')
+FileInfo = namedtuple('FileInfo', 'name path type size modified version', defaults=(None,))
+_by_version = attrgetter('version')
+
+# File list presentation per FileInfo.type
+_FILE_TYPE_ICONS = {
+    'hero': '👑',
+    'template': '📋',
+    'version': '📝'
+}
+_FILE_TYPE_BRUSHES = {
+    'hero': QBrush(QColor(255, 215, 0, 50)),      # Gold
+    'template': QBrush(QColor(0, 255, 0, 50)),    # Green
+    'version': QBrush(QColor(135, 206, 235, 50))  # Light blue
+}
+
+# Lighting dir entries: *_hero.ma/.mb, or *_template.*.ma/.mb (tested on normcase'd names)
+_LIGHTING_FILE_RE = re.compile(r'_(?:(?P<hero>hero\.)|template\.(?:.*\.)?)(?:ma|mb)$')
+
+
+def _dumps_json(obj):
+    """Serialize obj as indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-str keys, which json.dumps coerces
+            pass
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_json(path, obj):
+    """Write obj to path as indented JSON in one write"""
+    data = _dumps_json(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _read_json(path):
+    """Load a JSON file"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+@lru_cache(maxsize=1)
+def _user_pref_dir():
+    """Maya user prefs dir (queried once; constant for the session)"""
+    return cmds.internalVar(userPrefDir=True)
+
+
+@lru_cache(maxsize=1)
+def _maya_version():
+    """Maya version string (queried once; constant for the session)"""
+    return cmds.about(version=True)
+
 
 class ProjectStructure:
     """Project structure management for assets and shots"""
     
+    # Seconds a directory listing is served from memory before re-scanning
+    DIR_CACHE_TTL = 10.0
+    
     def __init__(self, root_path="V:/SWA/all"):
         self.root_path = root_path
         self.scene_path = os.path.join(root_path, "scene")
         self.asset_path = os.path.join(root_path, "asset")
+        # (path, prefix) -> (monotonic timestamp, sorted names)
+        self._dir_cache = {}
         
-    def get_episodes(self):
-        """Get list of episodes"""
-        episodes = []
-        if os.path.exists(self.scene_path):
+    def clear_cache(self):
+        """Drop cached directory listings so the next query re-scans disk"""
+        self._dir_cache.clear()
+    
+    def set_root(self, root_path):
+        """Point the structure at a new project root and drop cached listings"""
+        self.root_path = root_path
+        self.scene_path = os.path.join(root_path, "scene")
+        self.asset_path = os.path.join(root_path, "asset")
+        self.clear_cache()
+    
+    def invalidate_path(self, path):
+        """Drop cached listings of a single directory (all prefixes)"""
+        # Iterate a snapshot: pool-thread prefetches insert into the cache meanwhile
+        for key in list(self._dir_cache):
+            if key[0] == path:
+                self._dir_cache.pop(key, None)
+    
+    def _list_dirs(self, path, prefix=""):
+        """Sorted names of subdirectories of path starting with prefix"""
+        key = (path, prefix)
+        cached = self._dir_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.DIR_CACHE_TTL:
+            return list(cached[1])
+        
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            # Missing/unreadable root; not cached so a transient share error recovers
+            return []
+        
+        names = []
+        # DirEntry.is_dir() reuses the type info from the directory read,
+        # so there is no extra stat per child (matters on V:\ over SMB).
+        # The context manager closes the DIR handle promptly on Windows.
+        with entries:
             try:
-                for item in os.listdir(self.scene_path):
-                    ep_path = os.path.join(self.scene_path, item)
-                    if os.path.isdir(ep_path) and item.startswith("Ep"):
-                        episodes.append(item)
-            except (OSError, PermissionError):
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith(prefix):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        # One bad entry must not abort the whole listing
+                        continue
+                    if is_dir:
+                        names.append(name)
+            except OSError:
+                # Read failed mid-listing; keep what was gathered
                 pass
-        return sorted(episodes)
+        names.sort()
+        self._dir_cache[key] = (now, names)
+        return list(names)
+    
+    def prefetch_dirs(self, paths, prefix="", max_workers=8):
+        """Warm the listing cache for sibling directories in parallel
+        
+        Share readdirs are latency-bound, so threads overlap the round-trips.
+        Callers pass only the branch under the current selection, so the
+        entries are still fresh (DIR_CACHE_TTL) when the user reaches them.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(partial(self._list_dirs, prefix=prefix), paths))
+    
+    def get_episodes(self):
+        """Get list of episodes"""
+        return self._list_dirs(self.scene_path, "Ep")
     
     def get_sequences(self, episode):
         """Get sequences for episode"""
-        sequences = []
-        ep_path = os.path.join(self.scene_path, episode)
-        if os.path.exists(ep_path):
-            try:
-                for item in os.listdir(ep_path):
-                    seq_path = os.path.join(ep_path, item)
-                    if os.path.isdir(seq_path) and item.startswith("sq"):
-                        sequences.append(item)
-            except (OSError, PermissionError):
-                pass
-        return sorted(sequences)
+        return self._list_dirs(os.path.join(self.scene_path, episode), "sq")
     
     def get_shots(self, episode, sequence):
         """Get shots for sequence"""
-        shots = []
-        seq_path = os.path.join(self.scene_path, episode, sequence)
-        if os.path.exists(seq_path):
-            try:
-                for item in os.listdir(seq_path):
-                    shot_path = os.path.join(seq_path, item)
-                    if os.path.isdir(shot_path) and item.startswith("SH"):
-                        shots.append(item)
-            except (OSError, PermissionError):
-                pass
-        return sorted(shots)
+        return self._list_dirs(os.path.join(self.scene_path, episode, sequence), "SH")
     
     def get_asset_categories(self):
         """Get asset categories"""
-        categories = []
-        if os.path.exists(self.asset_path):
-            try:
-                for item in os.listdir(self.asset_path):
-                    cat_path = os.path.join(self.asset_path, item)
-                    if os.path.isdir(cat_path):
-                        categories.append(item)
-            except (OSError, PermissionError):
-                pass
-        return sorted(categories)
+        return self._list_dirs(self.asset_path)
     
     def get_asset_subcategories(self, category):
         """Get asset subcategories"""
-        subcategories = []
-        cat_path = os.path.join(self.asset_path, category)
-        if os.path.exists(cat_path):
-            try:
-                for item in os.listdir(cat_path):
-                    subcat_path = os.path.join(cat_path, item)
-                    if os.path.isdir(subcat_path):
-                        subcategories.append(item)
-            except (OSError, PermissionError):
-                pass
-        return sorted(subcategories)
+        return self._list_dirs(os.path.join(self.asset_path, category))
     
     def get_assets(self, category, subcategory):
         """Get assets in subcategory"""
-        assets = []
-        subcat_path = os.path.join(self.asset_path, category, subcategory)
-        if os.path.exists(subcat_path):
-            try:
-                for item in os.listdir(subcat_path):
-                    asset_path = os.path.join(subcat_path, item)
-                    if os.path.isdir(asset_path):
-                        assets.append(item)
-            except (OSError, PermissionError):
-                pass
-        return sorted(assets)
+        return self._list_dirs(os.path.join(self.asset_path, category, subcategory))
     
     def get_shot_lighting_path(self, episode, sequence, shot):
         """Get shot lighting directory path"""
@@ -183,11 +295,15 @@ class ProjectStructure:
     
     def ensure_path_exists(self, path):
         """Ensure directory path exists"""
-        if not os.path.exists(path):
-            try:
-                os.makedirs(path)
-            except (OSError, PermissionError) as e:
-                print(f"Could not create directory {path}: {e}")
+        try:
+            os.makedirs(path)
+        except FileExistsError:
+            pass
+        except (OSError, PermissionError) as e:
+            print(f"Could not create directory {path}: {e}")
+        else:
+            # New directories may belong to a cached listing
+            self.clear_cache()
         return path
 
 
@@ -195,41 +311,53 @@ class VersionManager:
     """Version and hero file management"""
     
     def __init__(self):
-        self.version_pattern = re.compile(r'v(\d{3,4})')
+        self.version_pattern = _VERSION_RE
         
+    def iter_versions(self, version_dir):
+        """Yield VersionInfo records (unsorted) as the directory is scanned"""
+        try:
+            # One scandir pass; entry.stat() supplies size/mtime for callers
+            with os.scandir(version_dir) as entries:
+                for entry in entries:
+                    item = entry.name
+                    # Split once: extension check and version search share it
+                    stem, _, ext = item.rpartition('.')
+                    if ext not in _MAYA_SCENE_EXTS:
+                        continue
+                    match = self.version_pattern.search(stem)
+                    if not match:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield VersionInfo(item, int(match.group(1)), entry.path,
+                                      st.st_size, st.st_mtime)
+        except (OSError, PermissionError):
+            return
+    
     def get_versions(self, version_dir):
         """Get all versions in directory"""
-        versions = []
-        if os.path.exists(version_dir):
-            try:
-                for item in os.listdir(version_dir):
-                    item_path = os.path.join(version_dir, item)
-                    if os.path.isfile(item_path) and item.endswith(('.ma', '.mb')):
-                        match = self.version_pattern.search(item)
-                        if match:
-                            version_num = int(match.group(1))
-                            versions.append({
-                                'file': item,
-                                'version': version_num,
-                                'path': item_path
-                            })
-            except (OSError, PermissionError):
-                pass
-        return sorted(versions, key=lambda x: x['version'])
+        return sorted(self.iter_versions(version_dir), key=_by_version)
     
     def get_next_version(self, version_dir, base_name, extension=".ma"):
         """Get next version number and filename"""
-        versions = self.get_versions(version_dir)
-        
-        if not versions:
-            next_version = 1
-        else:
-            # Filter versions for this base name
-            matching_versions = [v for v in versions if base_name in v['file']]
-            if matching_versions:
-                next_version = matching_versions[-1]['version'] + 1
-            else:
-                next_version = 1
+        # Single pass tracking the highest version of exactly this base name
+        pattern = re.compile(re.escape(base_name) + r'_v(\d{3,4})\.(?:ma|mb)$')
+        max_version = 0
+        try:
+            with os.scandir(version_dir) as entries:
+                for entry in entries:
+                    match = pattern.match(entry.name)
+                    if match:
+                        version = int(match.group(1))
+                        if version > max_version:
+                            max_version = version
+        except (OSError, PermissionError):
+            pass
+        next_version = max_version + 1
         
         version_str = f"v{next_version:04d}"
         filename = f"{base_name}_{version_str}{extension}"
@@ -240,35 +368,25 @@ class VersionManager:
     def create_hero_link(self, source_file, hero_path):
         """Create hero file (Windows junction/symlink)"""
         try:
-            # Remove existing hero file/link
-            if os.path.exists(hero_path):
-                try:
-                    if os.path.islink(hero_path):
-                        os.unlink(hero_path)
-                    elif os.path.isfile(hero_path):
-                        os.remove(hero_path)
-                except (OSError, PermissionError):
-                    pass
+            # Remove existing hero file/link (single syscall)
+            try:
+                os.unlink(hero_path)
+            except OSError:  # missing, or a directory/locked file we leave alone
+                pass
             
             # Try to create symbolic link (Windows 10+)
             try:
                 os.symlink(source_file, hero_path)
                 return True, f"Symbolic link created: {hero_path}"
             except OSError:
-                # Fallback: create hard link using mklink
+                # Fallback: hard link (CreateHardLinkW, no cmd.exe spawn)
                 try:
-                    cmd = f'mklink /H "{hero_path}" "{source_file}"'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        return True, f"Hard link created: {hero_path}"
-                    else:
-                        # Last fallback: copy file
-                        shutil.copy2(source_file, hero_path)
-                        return True, f"File copied (no link support): {hero_path}"
-                except Exception:
-                    # Ultimate fallback: copy file
+                    os.link(source_file, hero_path)
+                    return True, f"Hard link created: {hero_path}"
+                except OSError:
+                    # Last fallback: copy file
                     shutil.copy2(source_file, hero_path)
-                    return True, f"File copied: {hero_path}"
+                    return True, f"File copied (no link support): {hero_path}"
                     
         except Exception as e:
             return False, f"Error creating hero link: {str(e)}"
@@ -282,18 +400,17 @@ class VersionManager:
         try:
             # Ensure directories exist
             version_dir = os.path.join(lighting_dir, "version")
-            if not os.path.exists(version_dir):
-                os.makedirs(version_dir)
-            if not os.path.exists(lighting_dir):
-                os.makedirs(lighting_dir)
+            # version_dir lives inside lighting_dir, so this creates both
+            os.makedirs(version_dir, exist_ok=True)
             
             # Get next version
             version_num, filename, filepath = self.get_next_version(version_dir, base_name)
             
-            # Save current scene
+            # Save current scene (scene name is queried once, for previous_file)
             current_file = cmds.file(query=True, sceneName=True)
             cmds.file(rename=filepath)
-            cmds.file(save=True, type="mayaAscii")
+            # Target is a fresh version file; force skips any overwrite prompt
+            cmds.file(save=True, type="mayaAscii", force=True)
             
             # Create version info file
             info_file = filepath.replace(".ma", "_info.json")
@@ -303,12 +420,11 @@ class VersionManager:
                 "description": description,
                 "timestamp": datetime.now().isoformat(),
                 "user": os.getenv("USERNAME", "unknown"),
-                "maya_version": cmds.about(version=True),
+                "maya_version": _maya_version(),
                 "previous_file": current_file
             }
             
-            with open(info_file, 'w', encoding='utf-8') as f:
-                json.dump(version_info, f, indent=2)
+            _write_json(info_file, version_info)
             
             # Create/update hero file
             hero_message = ""
@@ -341,48 +457,48 @@ class AssetShotNavigator:
         else:
             return []
         
-        if not os.path.exists(lighting_dir):
-            return []
-        
         files = []
         
         try:
-            # Get hero files
-            for ext in [".ma", ".mb"]:
-                hero_pattern = os.path.join(lighting_dir, f"*_hero{ext}")
-                for hero_file in glob.glob(hero_pattern):
-                    files.append({
-                        'name': os.path.basename(hero_file),
-                        'path': hero_file,
-                        'type': 'hero',
-                        'size': os.path.getsize(hero_file),
-                        'modified': datetime.fromtimestamp(os.path.getmtime(hero_file))
-                    })
+            # One scandir pass over the lighting dir; each entry is stat'ed once
+            heroes = []
+            templates = []
+            with os.scandir(lighting_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # normcase mirrors glob's case handling on Windows
+                    match = _LIGHTING_FILE_RE.search(os.path.normcase(name))
+                    if not match:
+                        continue
+                    if match.group('hero'):
+                        bucket, file_type = heroes, 'hero'
+                    else:
+                        bucket, file_type = templates, 'template'
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    bucket.append(FileInfo(name, entry.path, file_type, st.st_size,
+                                           datetime.fromtimestamp(st.st_mtime)))
             
-            # Get template files
-            template_pattern = os.path.join(lighting_dir, "*_template.*")
-            for template_file in glob.glob(template_pattern):
-                if template_file.endswith(('.ma', '.mb')):
-                    files.append({
-                        'name': os.path.basename(template_file),
-                        'path': template_file,
-                        'type': 'template',
-                        'size': os.path.getsize(template_file),
-                        'modified': datetime.fromtimestamp(os.path.getmtime(template_file))
-                    })
+            # Hero files (.ma before .mb), then template files
+            heroes.sort(key=lambda f: (not f.name.endswith('.ma'), f.name))
+            files.extend(heroes)
+            files.extend(templates)
             
             # Get version files
             version_dir = os.path.join(lighting_dir, "version")
-            versions = self.version_manager.get_versions(version_dir)
-            for version_info in versions[-10:]:  # Last 10 versions
-                files.append({
-                    'name': version_info['file'],
-                    'path': version_info['path'],
-                    'type': 'version',
-                    'version': version_info['version'],
-                    'size': os.path.getsize(version_info['path']),
-                    'modified': datetime.fromtimestamp(os.path.getmtime(version_info['path']))
-                })
+            # Last 10 versions without sorting the full history
+            versions = heapq.nlargest(10, self.version_manager.iter_versions(version_dir),
+                                      key=_by_version)
+            versions.sort(key=_by_version)  # back to ascending display order
+            for version_info in versions:
+                files.append(FileInfo(version_info.file, version_info.path, 'version',
+                                      version_info.size,
+                                      datetime.fromtimestamp(version_info.mtime),
+                                      version_info.version))
         except (OSError, PermissionError):
             pass
         
@@ -424,6 +540,7 @@ class AssetShotNavigator:
             template_path = os.path.join(lighting_dir, f"{template_name}.ma")
             cmds.file(rename=template_path)
             cmds.file(save=True, type="mayaAscii")
+            self.project.clear_cache()
             
             return True, f"Template exported: {template_path}"
             
@@ -435,16 +552,21 @@ class RenderSetupManager:
     """Core render setup management functionality"""
     
     def __init__(self):
-        self.templates_dir = os.path.join(cmds.internalVar(userPrefDir=True), "renderSetupTemplates")
+        self.templates_dir = os.path.join(_user_pref_dir(), "renderSetupTemplates")
+        # templates_dir + separator, joined once; template_path only concatenates
+        self._template_prefix = os.path.join(self.templates_dir, "")
         self.ensure_templates_directory()
         
+    def template_path(self, name):
+        """Path of the JSON file for template `name`"""
+        return f"{self._template_prefix}{name}.json"
+    
     def ensure_templates_directory(self):
         """Ensure templates directory exists"""
-        if not os.path.exists(self.templates_dir):
-            try:
-                os.makedirs(self.templates_dir)
-            except (OSError, PermissionError):
-                print(f"Could not create templates directory: {self.templates_dir}")
+        try:
+            os.makedirs(self.templates_dir, exist_ok=True)
+        except (OSError, PermissionError):
+            print(f"Could not create templates directory: {self.templates_dir}")
     
     def create_template_rendersetup(self, name, description="", layers_config=None):
         """Create a template render setup"""
@@ -474,9 +596,8 @@ class RenderSetupManager:
                 "renderSetup": self._serialize_render_setup()
             }
             
-            template_file = os.path.join(self.templates_dir, f"{name}.json")
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template_data, f, indent=2)
+            template_file = self.template_path(name)
+            _write_json(template_file, template_data)
             
             return True, f"Template '{name}' created successfully"
             
@@ -535,17 +656,23 @@ class RenderSetupManager:
     def export_rendersetup(self, filepath):
         """Export current render setup to file"""
         try:
-            data = {
-                "renderSetup": self._serialize_render_setup(),
-                "exportTime": cmds.date(),
-                "mayaVersion": cmds.about(version=True)
-            }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            
+            return self.write_rendersetup_export(filepath, self.rendersetup_export_data())
+        except Exception as e:
+            return False, f"Error exporting render setup: {str(e)}"
+    
+    def rendersetup_export_data(self):
+        """Export payload for the current render setup (queries Maya: main thread only)"""
+        return {
+            "renderSetup": self._serialize_render_setup(),
+            "exportTime": cmds.date(),
+            "mayaVersion": _maya_version()
+        }
+    
+    def write_rendersetup_export(self, filepath, data):
+        """Write an export payload to disk (plain file I/O, safe off the main thread)"""
+        try:
+            _write_json(filepath, data)
             return True, f"Render setup exported to {filepath}"
-            
         except Exception as e:
             return False, f"Error exporting render setup: {str(e)}"
 
@@ -567,15 +694,12 @@ class LightManager:
         }
         
         # Try to load from user prefs
-        rules_file = os.path.join(cmds.internalVar(userPrefDir=True), "lightNamingRules.json")
-        if os.path.exists(rules_file):
-            try:
-                with open(rules_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return default_rules
+        rules_file = os.path.join(_user_pref_dir(), "lightNamingRules.json")
+        try:
+            return _read_json(rules_file)
+        except (OSError, ValueError):
+            # Missing/unreadable file or invalid JSON
+            return default_rules
     
     def generate_light_name(self, prefix="", suffix="", index=1):
         """Generate light name based on rules"""
@@ -615,11 +739,10 @@ class LightManager:
             light_shapes = cmds.ls(type=["directionalLight", "pointLight", "spotLight", 
                                         "areaLight", "aiAreaLight", "aiSkyDomeLight"])
             
+            # One listRelatives for all shapes instead of one command per light
             light_transforms = []
-            for shape in light_shapes:
-                transform = cmds.listRelatives(shape, parent=True, type="transform")
-                if transform:
-                    light_transforms.extend(transform)
+            if light_shapes:
+                light_transforms = cmds.listRelatives(light_shapes, parent=True, type="transform") or []
             
             if not light_transforms:
                 return False, "No lights found in scene"
@@ -637,6 +760,13 @@ class LightManager:
             return False, f"Error exporting lights: {str(e)}"
 
 
+@lru_cache(maxsize=256)
+def _dag_path_to_regex(path, escape_special, use_wildcards):
+    """Single-path body of RegexConverter.dag_paths_to_regex (memoized)"""
+    # Escaping and wildcard conversion happen in a single translate pass
+    return path.translate(_DAG_REGEX_TABLES[escape_special, use_wildcards])
+
+
 class RegexConverter:
     """Regex conversion tools"""
     
@@ -651,17 +781,10 @@ class RegexConverter:
         use_wildcards = options.get("use_wildcards", True)
         
         # Process paths
-        processed_paths = []
-        for path in dag_paths:
-            if escape_special:
-                # Escape special regex characters except | and *
-                path = re.escape(path).replace(r"\|", "|").replace(r"\*", "*")
-            
-            if use_wildcards:
-                # Convert Maya wildcards to regex
-                path = path.replace("*", ".*").replace("?", ".")
-            
-            processed_paths.append(path)
+        processed_paths = [
+            _dag_path_to_regex(path, bool(escape_special), bool(use_wildcards))
+            for path in dag_paths
+        ]
         
         # Create pattern
         if len(processed_paths) == 1:
@@ -670,6 +793,83 @@ class RegexConverter:
             return "(" + "|".join(processed_paths) + ")"
 
 
+def _add_labeled_row(layout, label_text, widget):
+    """Append a 'label: widget' row to layout"""
+    row = QHBoxLayout()
+    row.addWidget(QLabel(label_text))
+    row.addWidget(widget)
+    layout.addLayout(row)
+    return row
+
+
+class _CallSignals(QObject):
+    """Signals for _CallWorker (QRunnable itself is not a QObject)"""
+    done = Signal(object, bool, str)  # worker, success, message
+
+
+class _CallWorker(QRunnable):
+    """Run a callable returning (success, message) on a pool thread
+    
+    Only for plain file I/O; Maya commands must stay on the main thread.
+    The owner's slot calls `on_done(success, message)` back on the GUI thread.
+    """
+    
+    def __init__(self, func, args, on_done, error_prefix):
+        super(_CallWorker, self).__init__()
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.error_prefix = error_prefix
+        self.progress = None
+        self.signals = _CallSignals()
+    
+    def run(self):
+        try:
+            success, message = self.func(*self.args)
+        except Exception as e:
+            success, message = False, f"{self.error_prefix}: {str(e)}"
+        self.signals.done.emit(self, success, message)
+
+
+class _ProjectListSignals(QObject):
+    """Signals for _ProjectListWorker"""
+    lists_ready = Signal(str, list, list)  # root_path, episodes, asset categories
+
+
+class _ProjectListWorker(QRunnable):
+    """List the project's top-level folders on a pool thread
+    
+    Only ProjectStructure (and its listing cache) is touched here, never widgets.
+    """
+    
+    def __init__(self, project_structure):
+        super(_ProjectListWorker, self).__init__()
+        self.project_structure = project_structure
+        self.signals = _ProjectListSignals()
+    
+    def run(self):
+        structure = self.project_structure
+        root_path = structure.root_path
+        self.signals.lists_ready.emit(root_path, structure.get_episodes(),
+                                      structure.get_asset_categories())
+
+
+class _PrefetchWorker(QRunnable):
+    """Warm ProjectStructure's listing cache for a few directories on a pool thread"""
+    
+    def __init__(self, project_structure, paths, prefix=""):
+        super(_PrefetchWorker, self).__init__()
+        self.project_structure = project_structure
+        self.paths = paths
+        self.prefix = prefix
+    
+    def run(self):
+        try:
+            self.project_structure.prefetch_dirs(self.paths, self.prefix)
+        except Exception as e:
+            print(f"Project prefetch failed: {e}")
+
+
 class RenderSetupUI(QMainWindow):
     """Main UI for Render Setup Manager"""
     
@@ -681,6 +881,12 @@ class RenderSetupUI(QMainWindow):
         self.project_structure = ProjectStructure()
         self.asset_shot_navigator = AssetShotNavigator(self.project_structure)
         self.version_manager = VersionManager()
+        # Tab indices whose (network-backed) contents have been loaded
+        self._tab_initialized = set()
+        # Running _CallWorkers (kept alive until their result is delivered)
+        self._io_workers = set()
+        # Application-wide clipboard, looked up once
+        self._clipboard = QApplication.clipboard()
         
         self.setWindowTitle("Render Setup Manager v2.0")
         self.setMinimumSize(700, 900)
@@ -699,12 +905,16 @@ class RenderSetupUI(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Setup tabs
+        # Setup tabs; only the default navigator tab is built up front, the
+        # others get a placeholder and are built when first opened
         self.setup_asset_shot_navigator_tab()
-        self.setup_render_setup_tab()
-        self.setup_light_manager_tab()
-        self.setup_regex_tools_tab()
-        self.setup_settings_tab()
+        self._tab_builders = {}
+        for title, builder in (("🎨 Render Setup", self._build_render_setup_tab),
+                               ("💡 Light Manager", self._build_light_manager_tab),
+                               ("🔧 Regex Tools", self._build_regex_tools_tab),
+                               ("⚙️ Settings", self._build_settings_tab)):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
     
     def setup_asset_shot_navigator_tab(self):
         """Setup asset and shot navigator tab"""
@@ -731,35 +941,26 @@ class RenderSetupUI(QMainWindow):
         shot_group_layout = QVBoxLayout(shot_group)
         
         # Episode selection
-        ep_layout = QHBoxLayout()
-        ep_layout.addWidget(QLabel("Episode:"))
         self.episode_combo = QComboBox()
         self.episode_combo.currentTextChanged.connect(self.on_episode_changed)
-        ep_layout.addWidget(self.episode_combo)
-        shot_group_layout.addLayout(ep_layout)
+        _add_labeled_row(shot_group_layout, "Episode:", self.episode_combo)
         
         # Sequence selection
-        seq_layout = QHBoxLayout()
-        seq_layout.addWidget(QLabel("Sequence:"))
         self.sequence_combo = QComboBox()
         self.sequence_combo.currentTextChanged.connect(self.on_sequence_changed)
-        seq_layout.addWidget(self.sequence_combo)
-        shot_group_layout.addLayout(seq_layout)
+        _add_labeled_row(shot_group_layout, "Sequence:", self.sequence_combo)
         
         # Shot selection
-        shot_layout = QHBoxLayout()
-        shot_layout.addWidget(QLabel("Shot:"))
         self.shot_combo = QComboBox()
         self.shot_combo.currentTextChanged.connect(self.on_shot_changed)
-        shot_layout.addWidget(self.shot_combo)
-        shot_group_layout.addLayout(shot_layout)
+        _add_labeled_row(shot_group_layout, "Shot:", self.shot_combo)
         
         # Shot file list
         shot_group_layout.addWidget(QLabel("Shot Files:"))
         self.shot_file_list = QListWidget()
         self.shot_file_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.shot_file_list.customContextMenuRequested.connect(self.show_shot_file_context_menu)
-        self.shot_file_list.itemDoubleClicked.connect(lambda: self.import_selected_file("reference"))
+        self.shot_file_list.itemDoubleClicked.connect(partial(self.import_selected_file, "reference"))
         shot_group_layout.addWidget(self.shot_file_list)
         
         # Shot actions
@@ -767,6 +968,8 @@ class RenderSetupUI(QMainWindow):
         refresh_shot_btn = QPushButton("🔄 Refresh")
         save_shot_version_btn = QPushButton("💾 Save Version")
         export_shot_template_btn = QPushButton("📤 Export Template")
+        # Refresh forces a re-scan: drop cached listings first
+        refresh_shot_btn.clicked.connect(self.project_structure.clear_cache)
         refresh_shot_btn.clicked.connect(self.refresh_shot_files)
         save_shot_version_btn.clicked.connect(self.save_shot_version)
         export_shot_template_btn.clicked.connect(self.export_shot_template)
@@ -783,35 +986,26 @@ class RenderSetupUI(QMainWindow):
         asset_group_layout = QVBoxLayout(asset_group)
         
         # Category selection
-        cat_layout = QHBoxLayout()
-        cat_layout.addWidget(QLabel("Category:"))
         self.asset_category_combo = QComboBox()
         self.asset_category_combo.currentTextChanged.connect(self.on_asset_category_changed)
-        cat_layout.addWidget(self.asset_category_combo)
-        asset_group_layout.addLayout(cat_layout)
+        _add_labeled_row(asset_group_layout, "Category:", self.asset_category_combo)
         
         # Subcategory selection
-        subcat_layout = QHBoxLayout()
-        subcat_layout.addWidget(QLabel("Subcategory:"))
         self.asset_subcategory_combo = QComboBox()
         self.asset_subcategory_combo.currentTextChanged.connect(self.on_asset_subcategory_changed)
-        subcat_layout.addWidget(self.asset_subcategory_combo)
-        asset_group_layout.addLayout(subcat_layout)
+        _add_labeled_row(asset_group_layout, "Subcategory:", self.asset_subcategory_combo)
         
         # Asset selection
-        asset_layout = QHBoxLayout()
-        asset_layout.addWidget(QLabel("Asset:"))
         self.asset_combo = QComboBox()
         self.asset_combo.currentTextChanged.connect(self.on_asset_changed)
-        asset_layout.addWidget(self.asset_combo)
-        asset_group_layout.addLayout(asset_layout)
+        _add_labeled_row(asset_group_layout, "Asset:", self.asset_combo)
         
         # Asset file list
         asset_group_layout.addWidget(QLabel("Asset Files:"))
         self.asset_file_list = QListWidget()
         self.asset_file_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.asset_file_list.customContextMenuRequested.connect(self.show_asset_file_context_menu)
-        self.asset_file_list.itemDoubleClicked.connect(lambda: self.import_selected_file("reference"))
+        self.asset_file_list.itemDoubleClicked.connect(partial(self.import_selected_file, "reference"))
         asset_group_layout.addWidget(self.asset_file_list)
         
         # Asset actions
@@ -819,6 +1013,7 @@ class RenderSetupUI(QMainWindow):
         refresh_asset_btn = QPushButton("🔄 Refresh")
         save_asset_version_btn = QPushButton("💾 Save Version")
         export_asset_template_btn = QPushButton("📤 Export Template")
+        refresh_asset_btn.clicked.connect(self.project_structure.clear_cache)
         refresh_asset_btn.clicked.connect(self.refresh_asset_files)
         save_asset_version_btn.clicked.connect(self.save_asset_version)
         export_asset_template_btn.clicked.connect(self.export_asset_template)
@@ -842,9 +1037,11 @@ class RenderSetupUI(QMainWindow):
         open_file_btn = QPushButton("📂 Open Selected")
         reference_file_btn = QPushButton("🔗 Reference Selected")
         import_file_btn = QPushButton("📥 Import Selected")
-        open_file_btn.clicked.connect(lambda: self.import_selected_file("open"))
-        reference_file_btn.clicked.connect(lambda: self.import_selected_file("reference"))
-        import_file_btn.clicked.connect(lambda: self.import_selected_file("import"))
+        # partial() forwards clicked(bool) / itemDoubleClicked(item) arguments;
+        # import_selected_file accepts and ignores them
+        open_file_btn.clicked.connect(partial(self.import_selected_file, "open"))
+        reference_file_btn.clicked.connect(partial(self.import_selected_file, "reference"))
+        import_file_btn.clicked.connect(partial(self.import_selected_file, "import"))
         
         actions_layout.addWidget(open_file_btn)
         actions_layout.addWidget(reference_file_btn)
@@ -853,15 +1050,11 @@ class RenderSetupUI(QMainWindow):
         
         layout.addWidget(actions_group)
         
-        # Initialize data
-        self.refresh_episodes()
-        self.refresh_asset_categories()
-        
-        self.tab_widget.addTab(tab, "🏠 Asset/Shot Navigator")
+        # Episodes/categories are scanned when the tab is first shown
+        self._navigator_tab_index = self.tab_widget.addTab(tab, "🏠 Asset/Shot Navigator")
     
-    def setup_render_setup_tab(self):
-        """Setup render setup management tab"""
-        tab = QWidget()
+    def _build_render_setup_tab(self, tab):
+        """Build the render setup management tab inside its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Template section
@@ -879,8 +1072,14 @@ class RenderSetupUI(QMainWindow):
         template_layout.addLayout(create_layout)
         
         # Template browser
-        self.template_list = QListWidget()
-        self.refresh_template_list()
+        # Plain names only: a string list model is filled in one call
+        self.template_list = QListView()
+        self._template_model = QStringListModel(self.template_list)
+        self.template_list.setModel(self._template_model)
+        # QListWidget items were read-only; string list models are editable
+        self.template_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Filled after the freshly built tab has painted
+        QTimer.singleShot(0, self.refresh_template_list)
         template_layout.addWidget(QLabel("Templates:"))
         template_layout.addWidget(self.template_list)
         
@@ -911,12 +1110,9 @@ class RenderSetupUI(QMainWindow):
         delete_template_btn.clicked.connect(self.delete_template)
         export_btn.clicked.connect(self.export_render_setup)
         import_btn.clicked.connect(self.import_render_setup)
-        
-        self.tab_widget.addTab(tab, "🎨 Render Setup")
     
-    def setup_light_manager_tab(self):
-        """Setup light manager tab"""
-        tab = QWidget()
+    def _build_light_manager_tab(self, tab):
+        """Build the light manager tab inside its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Light naming section
@@ -972,7 +1168,8 @@ class RenderSetupUI(QMainWindow):
         light_list_layout = QVBoxLayout(light_list_group)
         
         self.light_list = QListWidget()
-        self.refresh_light_list()
+        # Scene light query runs after the freshly built tab has painted
+        QTimer.singleShot(0, self.refresh_light_list)
         light_list_layout.addWidget(self.light_list)
         
         refresh_lights_btn = QPushButton("Refresh Light List")
@@ -990,12 +1187,9 @@ class RenderSetupUI(QMainWindow):
         refresh_lights_btn.clicked.connect(self.refresh_light_list)
         
         self.update_name_preview()
-        
-        self.tab_widget.addTab(tab, "💡 Light Manager")
     
-    def setup_regex_tools_tab(self):
-        """Setup regex converter tools tab"""
-        tab = QWidget()
+    def _build_regex_tools_tab(self, tab):
+        """Build the regex converter tools tab inside its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # DAG path converter
@@ -1044,12 +1238,9 @@ class RenderSetupUI(QMainWindow):
         # Connect signals
         convert_dag_btn.clicked.connect(self.convert_dag_to_regex)
         selected_to_regex_btn.clicked.connect(self.selected_to_regex)
-        
-        self.tab_widget.addTab(tab, "🔧 Regex Tools")
     
-    def setup_settings_tab(self):
-        """Setup settings tab"""
-        tab = QWidget()
+    def _build_settings_tab(self, tab):
+        """Build the settings tab inside its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Naming rules settings
@@ -1078,12 +1269,54 @@ class RenderSetupUI(QMainWindow):
         
         # Connect signals
         save_settings_btn.clicked.connect(self.save_settings)
-        
-        self.tab_widget.addTab(tab, "⚙️ Settings")
     
     def connect_signals(self):
         """Connect additional signals"""
-        pass
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        
+        # Native change notifications for the displayed lighting dirs
+        self._file_watcher = QFileSystemWatcher(self)
+        self._file_watcher.directoryChanged.connect(self._on_watched_dir_changed)
+        self._watched_dirs = {}  # path -> file list refresh method
+        
+        # File list rescans are debounced: a save touches several files and
+        # scrolling through shots/assets fires one change per step
+        self._pending_file_refreshes = set()
+        self._file_refresh_timer = QTimer(self)
+        self._file_refresh_timer.setSingleShot(True)
+        self._file_refresh_timer.setInterval(200)
+        self._file_refresh_timer.timeout.connect(self._flush_file_refreshes)
+    
+    def showEvent(self, event):
+        """Load the visible tab's data on first show rather than at construction"""
+        super(RenderSetupUI, self).showEvent(event)
+        self._on_tab_changed(self.tab_widget.currentIndex())
+    
+    def _on_tab_changed(self, index):
+        """Build a deferred tab / populate its listings the first time it is opened"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tab_widget.widget(index))
+        if index in self._tab_initialized:
+            return
+        if index == self._navigator_tab_index:
+            self._tab_initialized.add(index)
+            self._start_project_listing()
+    
+    def _start_project_listing(self):
+        """List episodes/asset categories off the GUI thread; combos fill on arrival"""
+        worker = _ProjectListWorker(self.project_structure)
+        # Bound slot on this QObject: delivered queued on the GUI thread
+        worker.signals.lists_ready.connect(self._on_project_lists_ready)
+        self._project_list_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_project_lists_ready(self, root_path, episodes, categories):
+        """Fill the top-level combos from a finished _ProjectListWorker"""
+        if root_path != self.project_structure.root_path:
+            return  # root changed while listing; a newer worker is on its way
+        self._repopulate_combo(self.episode_combo, episodes)
+        self._repopulate_combo(self.asset_category_combo, categories)
     
     # === PROJECT NAVIGATION METHODS ===
     
@@ -1092,65 +1325,72 @@ class RenderSetupUI(QMainWindow):
         path = QFileDialog.getExistingDirectory(self, "Select Project Root Directory")
         if path:
             self.root_path_edit.setText(path)
-            self.project_structure.root_path = path
-            self.project_structure.scene_path = os.path.join(path, "scene")
-            self.project_structure.asset_path = os.path.join(path, "asset")
-            self.refresh_episodes()
-            self.refresh_asset_categories()
-    
-    def refresh_episodes(self):
-        """Refresh episode list"""
-        self.episode_combo.clear()
-        episodes = self.project_structure.get_episodes()
-        self.episode_combo.addItems(episodes)
-    
-    def refresh_asset_categories(self):
-        """Refresh asset category list"""
-        self.asset_category_combo.clear()
-        categories = self.project_structure.get_asset_categories()
-        self.asset_category_combo.addItems(categories)
+            self.project_structure.set_root(path)
+            self._start_project_listing()
+    
+    def _repopulate_combo(self, combo, items):
+        """Replace combo items, emitting currentTextChanged once for the final selection"""
+        # clear()/addItems() would otherwise each fire the cascade handlers
+        blocker = QSignalBlocker(combo)
+        combo.clear()
+        combo.addItems(items)
+        blocker.unblock()
+        combo.currentTextChanged.emit(combo.currentText())
+    
+    def _start_prefetch(self, parent_path, names, prefix=""):
+        """List the children of parent_path/<name> in the background"""
+        if not names:
+            return
+        paths = [os.path.join(parent_path, name) for name in names]
+        worker = _PrefetchWorker(self.project_structure, paths, prefix)
+        self._prefetch_worker = worker
+        QThreadPool.globalInstance().start(worker)
     
     def on_episode_changed(self, episode):
         """Handle episode selection change"""
-        self.sequence_combo.clear()
+        sequences = self.project_structure.get_sequences(episode) if episode else []
+        self._repopulate_combo(self.sequence_combo, sequences)
         if episode:
-            sequences = self.project_structure.get_sequences(episode)
-            self.sequence_combo.addItems(sequences)
+            # Shot listings of this episode's other sequences, one level down
+            self._start_prefetch(os.path.join(self.project_structure.scene_path, episode),
+                                 sequences[1:], "SH")
     
     def on_sequence_changed(self, sequence):
         """Handle sequence selection change"""
-        self.shot_combo.clear()
+        shots = []
         if sequence:
             episode = self.episode_combo.currentText()
             if episode:
                 shots = self.project_structure.get_shots(episode, sequence)
-                self.shot_combo.addItems(shots)
+        self._repopulate_combo(self.shot_combo, shots)
     
     def on_shot_changed(self, shot):
         """Handle shot selection change"""
         if shot:
-            self.refresh_shot_files()
+            self._schedule_file_refresh(self.refresh_shot_files)
     
     def on_asset_category_changed(self, category):
         """Handle asset category selection change"""
-        self.asset_subcategory_combo.clear()
+        subcategories = self.project_structure.get_asset_subcategories(category) if category else []
+        self._repopulate_combo(self.asset_subcategory_combo, subcategories)
         if category:
-            subcategories = self.project_structure.get_asset_subcategories(category)
-            self.asset_subcategory_combo.addItems(subcategories)
+            # Asset listings of this category's other subcategories, one level down
+            self._start_prefetch(os.path.join(self.project_structure.asset_path, category),
+                                 subcategories[1:])
     
     def on_asset_subcategory_changed(self, subcategory):
         """Handle asset subcategory selection change"""
-        self.asset_combo.clear()
+        assets = []
         if subcategory:
             category = self.asset_category_combo.currentText()
             if category:
                 assets = self.project_structure.get_assets(category, subcategory)
-                self.asset_combo.addItems(assets)
+        self._repopulate_combo(self.asset_combo, assets)
     
     def on_asset_changed(self, asset):
         """Handle asset selection change"""
         if asset:
-            self.refresh_asset_files()
+            self._schedule_file_refresh(self.refresh_asset_files)
     
     # === FILE LIST METHODS ===
     
@@ -1162,9 +1402,12 @@ class RenderSetupUI(QMainWindow):
         sequence = self.sequence_combo.currentText()
         shot = self.shot_combo.currentText()
         
+        lighting_dir = None
         if episode and sequence and shot:
             files = self.asset_shot_navigator.get_lighting_files("shot", episode, sequence, shot)
             self._populate_file_list(self.shot_file_list, files)
+            lighting_dir = self.project_structure.get_shot_lighting_path(episode, sequence, shot)
+        self._watch_lighting_dir(self.refresh_shot_files, lighting_dir)
     
     def refresh_asset_files(self):
         """Refresh asset file list"""
@@ -1174,42 +1417,88 @@ class RenderSetupUI(QMainWindow):
         subcategory = self.asset_subcategory_combo.currentText()
         asset = self.asset_combo.currentText()
         
+        lighting_dir = None
         if category and subcategory and asset:
             files = self.asset_shot_navigator.get_lighting_files("asset", category, subcategory, asset)
             self._populate_file_list(self.asset_file_list, files)
+            lighting_dir = self.project_structure.get_asset_lighting_path(category, subcategory, asset)
+        self._watch_lighting_dir(self.refresh_asset_files, lighting_dir)
+    
+    def _watch_lighting_dir(self, refresh_method, lighting_dir):
+        """Watch lighting_dir (and its version dir) on behalf of one file list"""
+        old_dirs = [path for path, method in self._watched_dirs.items() if method == refresh_method]
+        if old_dirs:
+            self._file_watcher.removePaths(old_dirs)
+            for path in old_dirs:
+                del self._watched_dirs[path]
+        
+        if not lighting_dir:
+            return
+        new_dirs = [path for path in (lighting_dir, os.path.join(lighting_dir, "version"))
+                    if os.path.isdir(path)]
+        if not new_dirs:
+            # No lighting dir yet: watch the shot/asset folder so its creation
+            # (first save or template export) refreshes the list
+            parent_dir = os.path.dirname(lighting_dir)
+            if os.path.isdir(parent_dir):
+                new_dirs.append(parent_dir)
+        if new_dirs:
+            self._file_watcher.addPaths(new_dirs)
+            for path in new_dirs:
+                self._watched_dirs[path] = refresh_method
+    
+    def _on_watched_dir_changed(self, path):
+        """Invalidate cached listings and schedule the owning file list refresh"""
+        self.project_structure.invalidate_path(path)
+        refresh_method = self._watched_dirs.get(path)
+        if refresh_method is not None:
+            self._schedule_file_refresh(refresh_method)
+    
+    def _schedule_file_refresh(self, refresh_method):
+        """Queue a file list refresh; restarts the debounce timer"""
+        self._pending_file_refreshes.add(refresh_method)
+        self._file_refresh_timer.start()
+    
+    def _flush_file_refreshes(self):
+        """Run the queued file list refreshes once the selection settles"""
+        pending = list(self._pending_file_refreshes)
+        self._pending_file_refreshes.clear()
+        for refresh_method in pending:
+            refresh_method()
     
     def _populate_file_list(self, list_widget, files):
         """Populate file list widget with file data"""
-        for file_info in files:
-            item = QListWidgetItem()
-            
-            # Format display text with icons
-            file_type_icon = {
-                'hero': '👑',
-                'template': '📋',
-                'version': '📝'
-            }
-            
-            icon = file_type_icon.get(file_info['type'], '📄')
-            display_text = f"{icon} {file_info['name']}"
-            
-            if file_info['type'] == 'version':
-                display_text += f" (v{file_info['version']})"
-            
-            display_text += f" - {file_info['modified'].strftime('%Y-%m-%d %H:%M')}"
-            
-            item.setText(display_text)
-            item.setData(Qt.UserRole, file_info)
-            
-            # Color code by type
-            if file_info['type'] == 'hero':
-                item.setBackground(QColor(255, 215, 0, 50))  # Gold
-            elif file_info['type'] == 'template':
-                item.setBackground(QColor(0, 255, 0, 50))   # Green
-            elif file_info['type'] == 'version':
-                item.setBackground(QColor(135, 206, 235, 50))  # Light blue
-            
-            list_widget.addItem(item)
+        # One repaint and no per-item selection/model signals while filling
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            for file_info in files:
+                item = QListWidgetItem()
+                
+                # Format display text with icons
+                file_type = file_info.type
+                icon = _FILE_TYPE_ICONS.get(file_type, '📄')
+                display_text = f"{icon} {file_info.name}"
+                
+                if file_type == 'version':
+                    display_text += f" (v{file_info.version})"
+                
+                # Same text as strftime('%Y-%m-%d %H:%M') without parsing a format
+                display_text += f" - {file_info.modified.isoformat(' ', 'minutes')}"
+                
+                item.setText(display_text)
+                # Qt item data keeps the dict form used by the context-menu handlers
+                item.setData(Qt.UserRole, dict(file_info._asdict()))
+                
+                # Color code by type
+                brush = _FILE_TYPE_BRUSHES.get(file_type)
+                if brush is not None:
+                    item.setBackground(brush)
+                
+                list_widget.addItem(item)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
     
     # === CONTEXT MENU METHODS ===
     
@@ -1231,42 +1520,56 @@ class RenderSetupUI(QMainWindow):
         if not file_info:
             return
         
+        menu = self._get_file_context_menu()
+        is_version = file_info['type'] == 'version'
+        self._hero_separator.setVisible(is_version)
+        self._make_hero_action.setVisible(is_version)
+        
+        # Execute action (None when the menu is dismissed)
+        action = menu.exec_(list_widget.mapToGlobal(position))
+        handler = self._file_action_handlers.get(action)
+        if handler is not None:
+            handler(file_info)
+    
+    def _get_file_context_menu(self):
+        """File list context menu, built on first use and reused afterwards"""
+        menu = getattr(self, '_file_context_menu', None)
+        if menu is not None:
+            return menu
+        
         menu = QMenu(self)
         
         # File operations
-        open_action = menu.addAction("📂 Open")
-        reference_action = menu.addAction("🔗 Reference")
-        import_action = menu.addAction("📥 Import")
+        self._open_action = menu.addAction("📂 Open")
+        self._reference_action = menu.addAction("🔗 Reference")
+        self._import_action = menu.addAction("📥 Import")
         menu.addSeparator()
         
         # File management
-        show_in_explorer_action = menu.addAction("📁 Show in Explorer")
-        copy_path_action = menu.addAction("📋 Copy Path")
-        
-        if file_info['type'] == 'version':
-            menu.addSeparator()
-            make_hero_action = menu.addAction("👑 Make Hero")
-        
-        # Execute action
-        action = menu.exec_(list_widget.mapToGlobal(position))
+        self._show_in_explorer_action = menu.addAction("📁 Show in Explorer")
+        self._copy_path_action = menu.addAction("📋 Copy Path")
+        
+        # Version-only entry, shown per request
+        self._hero_separator = menu.addSeparator()
+        self._make_hero_action = menu.addAction("👑 Make Hero")
+        
+        # Action -> handler(file_info); the hero action is hidden for non-versions
+        self._file_action_handlers = {
+            self._open_action: lambda fi: self._import_file_with_info(fi, "open"),
+            self._reference_action: lambda fi: self._import_file_with_info(fi, "reference"),
+            self._import_action: lambda fi: self._import_file_with_info(fi, "import"),
+            self._show_in_explorer_action: lambda fi: self._show_in_explorer(fi['path']),
+            self._copy_path_action: lambda fi: self._clipboard.setText(fi['path']),
+            self._make_hero_action: self._make_hero_from_version,
+        }
         
-        if action == open_action:
-            self._import_file_with_info(file_info, "open")
-        elif action == reference_action:
-            self._import_file_with_info(file_info, "reference")
-        elif action == import_action:
-            self._import_file_with_info(file_info, "import")
-        elif action == show_in_explorer_action:
-            self._show_in_explorer(file_info['path'])
-        elif action == copy_path_action:
-            QApplication.clipboard().setText(file_info['path'])
-        elif file_info['type'] == 'version' and action == make_hero_action:
-            self._make_hero_from_version(file_info)
+        self._file_context_menu = menu
+        return menu
     
     # === FILE OPERATION METHODS ===
     
-    def import_selected_file(self, import_type):
-        """Import currently selected file"""
+    def import_selected_file(self, import_type, *_signal_args):
+        """Import currently selected file (extra signal arguments are ignored)"""
         # Determine which list is active
         current_tab = self.tab_widget.currentIndex()
         if current_tab != 0:  # Asset/Shot Navigator tab index
@@ -1296,10 +1599,10 @@ class RenderSetupUI(QMainWindow):
     
     def _show_in_explorer(self, filepath):
         """Show file in Windows Explorer"""
-        try:
-            subprocess.run(f'explorer /select,"{filepath}"', shell=True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not open explorer: {str(e)}")
+        # Detached: no cmd.exe in between and the UI thread does not wait
+        started = QProcess.startDetached("explorer", ["/select,", QDir.toNativeSeparators(filepath)])
+        if not started:
+            QMessageBox.critical(self, "Error", f"Could not open explorer for: {filepath}")
     
     def _make_hero_from_version(self, file_info):
         """Make hero file from version"""
@@ -1313,20 +1616,78 @@ class RenderSetupUI(QMainWindow):
             if lighting_dir.endswith('version'):
                 lighting_dir = os.path.dirname(lighting_dir)
             
-            # Create hero file
+            # Create hero file on a pool thread; the link/copy may hit the network share
             hero_path = self.version_manager.get_hero_path(lighting_dir, base_name)
-            success, message = self.version_manager.create_hero_link(file_info['path'], hero_path)
-            
-            if success:
-                QMessageBox.information(self, "Success", message)
-                # Refresh appropriate file list
-                self.refresh_shot_files() if self.shot_file_list.currentItem() else self.refresh_asset_files()
-            else:
-                QMessageBox.critical(self, "Error", message)
+            # Pick the list to refresh now, while the selection is known
+            refresh_method = (self.refresh_shot_files if self.shot_file_list.currentItem()
+                              else self.refresh_asset_files)
+            self._start_io_worker(self.version_manager.create_hero_link,
+                                  (file_info['path'], hero_path),
+                                  partial(self._on_hero_link_done, refresh_method),
+                                  "Error creating hero file")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error creating hero file: {str(e)}")
     
+    def _on_hero_link_done(self, refresh_method, success, message):
+        """Report a finished hero link and refresh its file list"""
+        self._report_result(success, message)
+        if success:
+            refresh_method()
+    
+    # === BACKGROUND / BUSY HELPERS ===
+    
+    def _report_result(self, success, message):
+        """Show a (success, message) result the way the manager reports everything"""
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.critical(self, "Error", message)
+    
+    def _show_busy_dialog(self, text):
+        """Show an indeterminate, non-cancellable progress dialog (deleted on close)"""
+        progress = QProgressDialog(self)
+        # The main window lives for the session; don't keep one child per export
+        progress.setAttribute(Qt.WA_DeleteOnClose)
+        progress.setWindowTitle("Render Setup Manager")
+        progress.setLabelText(text)
+        progress.setCancelButton(None)
+        progress.setRange(0, 0)
+        progress.setMinimumDuration(0)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.show()
+        return progress
+    
+    def _start_io_worker(self, func, args, on_done, error_prefix, busy_text=None):
+        """Run file I/O on the global QThreadPool; on_done runs on the GUI thread"""
+        worker = _CallWorker(func, args, on_done, error_prefix)
+        if busy_text:
+            worker.progress = self._show_busy_dialog(busy_text)
+        # Bound slot on this QObject: delivered queued on the GUI thread
+        worker.signals.done.connect(self._on_io_worker_done)
+        self._io_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_io_worker_done(self, worker, success, message):
+        """Close a finished _CallWorker's progress dialog and hand over its result"""
+        self._io_workers.discard(worker)
+        if worker.progress is not None:
+            worker.progress.close()
+            worker.progress = None
+        worker.on_done(success, message)
+    
+    def _run_busy(self, text, func):
+        """Run main-thread-only Maya work with a busy dialog and wait cursor"""
+        progress = self._show_busy_dialog(text)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        # Let the dialog paint before Maya blocks the event loop
+        QApplication.processEvents()
+        try:
+            return func()
+        finally:
+            QApplication.restoreOverrideCursor()
+            progress.close()
+    
     # === VERSION SAVING METHODS ===
     
     def save_shot_version(self):
@@ -1353,8 +1714,8 @@ class RenderSetupUI(QMainWindow):
         
         self._save_version_dialog("asset", category, subcategory, asset)
     
-    def _save_version_dialog(self, path_type, *args):
-        """Show save version dialog"""
+    def _build_save_version_dialog(self):
+        """Build the Save Version dialog; returns its widgets by name"""
         dialog = QDialog(self)
         dialog.setWindowTitle("💾 Save Version")
         dialog.setModal(True)
@@ -1365,12 +1726,6 @@ class RenderSetupUI(QMainWindow):
         # Base name
         layout.addWidget(QLabel("Base Name:"))
         base_name_edit = QLineEdit()
-        if path_type == "shot":
-            episode, sequence, shot = args
-            base_name_edit.setText(f"{episode}_{sequence}_{shot}_lighting")
-        else:
-            category, subcategory, asset = args
-            base_name_edit.setText(f"{category}_{subcategory}_{asset}_lighting")
         layout.addWidget(base_name_edit)
         
         # Description
@@ -1381,7 +1736,6 @@ class RenderSetupUI(QMainWindow):
         
         # Create hero checkbox
         create_hero_check = QCheckBox("👑 Create/Update Hero File")
-        create_hero_check.setChecked(True)
         layout.addWidget(create_hero_check)
         
         # Buttons
@@ -1396,6 +1750,34 @@ class RenderSetupUI(QMainWindow):
         save_btn.clicked.connect(dialog.accept)
         cancel_btn.clicked.connect(dialog.reject)
         
+        return {
+            "dialog": dialog,
+            "base_name_edit": base_name_edit,
+            "description_edit": description_edit,
+            "create_hero_check": create_hero_check
+        }
+    
+    def _save_version_dialog(self, path_type, *args):
+        """Show save version dialog"""
+        # Built once and reused; it is parented to the window and dies with it
+        widgets = getattr(self, '_save_version_dlg', None)
+        if widgets is None:
+            widgets = self._save_version_dlg = self._build_save_version_dialog()
+        dialog = widgets["dialog"]
+        base_name_edit = widgets["base_name_edit"]
+        description_edit = widgets["description_edit"]
+        create_hero_check = widgets["create_hero_check"]
+        
+        # Reset to the defaults a freshly built dialog would show
+        if path_type == "shot":
+            episode, sequence, shot = args
+            base_name_edit.setText(f"{episode}_{sequence}_{shot}_lighting")
+        else:
+            category, subcategory, asset = args
+            base_name_edit.setText(f"{category}_{subcategory}_{asset}_lighting")
+        description_edit.clear()
+        create_hero_check.setChecked(True)
+        
         if dialog.exec_() == QDialog.Accepted:
             base_name = base_name_edit.text().strip()
             description = description_edit.toPlainText().strip()
@@ -1416,6 +1798,8 @@ class RenderSetupUI(QMainWindow):
                 lighting_dir, base_name, description, create_hero)
             
             if success:
+                # save_with_version may have created new directories
+                self.project_structure.clear_cache()
                 QMessageBox.information(self, "Success", message)
                 if path_type == "shot":
                     self.refresh_shot_files()
@@ -1472,12 +1856,19 @@ class RenderSetupUI(QMainWindow):
     
     def refresh_template_list(self):
         """Refresh the template list"""
-        self.template_list.clear()
-        if os.path.exists(self.render_manager.templates_dir):
-            for file in os.listdir(self.render_manager.templates_dir):
-                if file.endswith('.json'):
-                    name = os.path.splitext(file)[0]
-                    self.template_list.addItem(name)
+        try:
+            # Names only: no per-entry path building or splitext
+            with os.scandir(self.render_manager.templates_dir) as entries:
+                names = [entry.name[:-5] for entry in entries
+                         if entry.name.endswith('.json') and entry.is_file()]
+        except OSError:
+            names = []
+        self._template_model.setStringList(names)
+    
+    def _current_template_name(self):
+        """Name of the current template in the list, or None"""
+        index = self.template_list.currentIndex()
+        return index.data() if index.isValid() else None
     
     def create_template(self):
         """Create a new template"""
@@ -1496,13 +1887,12 @@ class RenderSetupUI(QMainWindow):
     
     def load_template(self):
         """Load selected template"""
-        current_item = self.template_list.currentItem()
-        if not current_item:
+        template_name = self._current_template_name()
+        if not template_name:
             QMessageBox.warning(self, "Warning", "Please select a template.")
             return
         
-        template_name = current_item.text()
-        template_file = os.path.join(self.render_manager.templates_dir, f"{template_name}.json")
+        template_file = self.render_manager.template_path(template_name)
         
         if os.path.exists(template_file):
             QMessageBox.information(self, "Success", f"Template '{template_name}' loaded.")
@@ -1511,17 +1901,16 @@ class RenderSetupUI(QMainWindow):
     
     def delete_template(self):
         """Delete selected template"""
-        current_item = self.template_list.currentItem()
-        if not current_item:
+        template_name = self._current_template_name()
+        if not template_name:
             QMessageBox.warning(self, "Warning", "Please select a template.")
             return
         
-        template_name = current_item.text()
         reply = QMessageBox.question(self, "Confirm Delete", 
                                    f"Are you sure you want to delete template '{template_name}'?")
         
         if reply == QMessageBox.Yes:
-            template_file = os.path.join(self.render_manager.templates_dir, f"{template_name}.json")
+            template_file = self.render_manager.template_path(template_name)
             try:
                 os.remove(template_file)
                 QMessageBox.information(self, "Success", f"Template '{template_name}' deleted.")
@@ -1535,11 +1924,15 @@ class RenderSetupUI(QMainWindow):
             self, "Export Render Setup", "", "JSON Files (*.json)")
         
         if filepath:
-            success, message = self.render_manager.export_rendersetup(filepath)
-            if success:
-                QMessageBox.information(self, "Success", message)
-            else:
-                QMessageBox.critical(self, "Error", message)
+            # Scene queries stay on the main thread; only the file write is offloaded
+            try:
+                data = self.render_manager.rendersetup_export_data()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Error exporting render setup: {str(e)}")
+                return
+            self._start_io_worker(self.render_manager.write_rendersetup_export, (filepath, data),
+                                  self._report_result, "Error exporting render setup",
+                                  busy_text="Exporting render setup...")
     
     def import_render_setup(self):
         """Import render setup"""
@@ -1560,11 +1953,11 @@ class RenderSetupUI(QMainWindow):
             light_shapes = cmds.ls(type=["directionalLight", "pointLight", "spotLight", 
                                         "areaLight", "aiAreaLight", "aiSkyDomeLight"])
             
-            for shape in light_shapes:
-                transform = cmds.listRelatives(shape, parent=True, type="transform")
-                if transform:
-                    self.light_list.addItem(transform[0])
-        except:
+            # One listRelatives for all shapes instead of one command per light
+            if light_shapes:
+                transforms = cmds.listRelatives(light_shapes, parent=True, type="transform") or []
+                self.light_list.addItems(transforms)
+        except Exception:
             pass
     
     def update_name_preview(self):
@@ -1606,11 +1999,10 @@ class RenderSetupUI(QMainWindow):
             self, "Export Lights", "", "Maya Files (*.ma)")
         
         if filepath:
-            success, message = self.light_manager.export_lights_only(filepath)
-            if success:
-                QMessageBox.information(self, "Success", message)
-            else:
-                QMessageBox.critical(self, "Error", message)
+            # cmds.file must run on Maya's main thread; keep the user informed instead
+            success, message = self._run_busy(
+                "Exporting lights...", partial(self.light_manager.export_lights_only, filepath))
+            self._report_result(success, message)
     
     def import_lights(self):
         """Import lights only"""
@@ -1619,9 +2011,11 @@ class RenderSetupUI(QMainWindow):
         
         if filepath:
             try:
-                cmds.file(filepath, i=True, type="mayaAscii", 
-                         ignoreVersion=True, mergeNamespacesOnClash=False, 
-                         namespace=":", preserveReferences=True)
+                # cmds.file must run on Maya's main thread; keep the user informed instead
+                self._run_busy("Importing lights...", partial(
+                    cmds.file, filepath, i=True, type="mayaAscii",
+                    ignoreVersion=True, mergeNamespacesOnClash=False,
+                    namespace=":", preserveReferences=True))
                 QMessageBox.information(self, "Success", f"Lights imported from {filepath}")
                 self.refresh_light_list()
             except Exception as e:
@@ -1670,9 +2064,8 @@ class RenderSetupUI(QMainWindow):
             rules["case"] = self.case_combo.currentText()
             
             # Save naming rules
-            rules_file = os.path.join(cmds.internalVar(userPrefDir=True), "lightNamingRules.json")
-            with open(rules_file, 'w', encoding='utf-8') as f:
-                json.dump(rules, f, indent=2)
+            rules_file = os.path.join(_user_pref_dir(), "lightNamingRules.json")
+            _write_json(rules_file, rules)
             
             self.light_manager.naming_rules = rules
             QMessageBox.information(self, "Success", "Settings saved.")
@@ -1726,6 +2119,21 @@ def show_ui():
     """Show the Render Setup Manager UI"""
     global render_setup_ui
     
+    # Re-show the live window instead of rebuilding every tab's widget tree
+    if render_setup_ui is not None:
+        try:
+            if cmds.dockControl("renderSetupManagerDock", exists=True):
+                cmds.dockControl("renderSetupManagerDock", edit=True, visible=True)
+            else:
+                render_setup_ui.show()
+            render_setup_ui.raise_()
+            return render_setup_ui
+        except RuntimeError:
+            # Underlying Qt object was deleted; drop its dock and build anew below
+            render_setup_ui = None
+            if cmds.dockControl("renderSetupManagerDock", exists=True):
+                cmds.deleteUI("renderSetupManagerDock", control=True)
+    
     try:
         # Try dockable first
         render_setup_ui = create_dockable_ui()
@@ -1747,8 +2155,9 @@ def show_ui():
         return None
 
 
-# Global variable to keep reference
-render_setup_ui = None
+# Global variable to keep reference; kept across a re-exec of this file (the
+# plugin menu runs it that way) so show_ui() can re-show the live window
+render_setup_ui = globals().get("render_setup_ui")
 
 # === MAIN EXECUTION ===
 if __name__ == "__main__":